@@ -8,13 +8,15 @@ import json
 import re
 import sys
 import os
+from contextlib import nullcontext
 from pathlib import Path
 from html.parser import HTMLParser
 from typing import Dict, List, Any, Optional
 try:
-    from version_manager import version_file
+    from version_manager import batched_log, version_file
 except ImportError:
     version_file = None  # graceful fallback if module not found
+    batched_log = nullcontext  # yields log=None
 
 # ============================================
 # Embedded HTML Template
@@ -849,21 +851,23 @@ def main():
             sys.exit(1)
 
         print(f"Building {len(json_files)} evidence pages...")
-        for json_file in json_files:
-            slug = json_file.stem
+        # One versions.log write and index update for the whole run
+        with batched_log() as log:
+            for json_file in json_files:
+                slug = json_file.stem
 
-            with open(json_file, 'r', encoding='utf-8') as f:
-                config = json.load(f)
+                with open(json_file, 'r', encoding='utf-8') as f:
+                    config = json.load(f)
 
-            built_page = build_page(config, None)
+                built_page = build_page(config, None)
 
-            output_file = system_dir / config.get('outputFile', f'evidence-{slug}.html')
-            if version_file and output_file.exists():
-                version_file(output_file, reason=f"pre-build: --all ({slug})")
-            with open(output_file, 'w', encoding='utf-8') as f:
-                f.write(built_page)
+                output_file = system_dir / config.get('outputFile', f'evidence-{slug}.html')
+                if version_file and output_file.exists():
+                    version_file(output_file, reason=f"pre-build: --all ({slug})", log=log)
+                with open(output_file, 'w', encoding='utf-8') as f:
+                    f.write(built_page)
 
-            print(f"  ✓ Built {output_file.name} ({len(config['cards'])} cards)")
+                print(f"  ✓ Built {output_file.name} ({len(config['cards'])} cards)")
 
         print(f"\nDone! Built {len(json_files)} pages")
 
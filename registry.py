@@ -16,44 +16,116 @@ Usage:
     python registry.py summary                    Claim Summary Index
     python registry.py export-summary             Write index to study-registry.md
     python registry.py export-refs CLAIM [--json] Builder-ready study refs
-    python registry.py export-xlsx [CATEGORY]     Export studies to xlsx for review
+    python registry.py export-xlsx [CATEGORY] [--fast]  Export studies to xlsx for review
     python registry.py stale                      Studies verified >6 months ago
     python registry.py gaps [--category CAT]      Claims with weak or missing evidence
     python registry.py supersede OLD_ID NEW_ID    Mark a study as superseded
-    python registry.py enrich-all                 List studies with incomplete fields
+    python registry.py enrich-all [--top N]       List studies with incomplete fields
     python registry.py add                        Interactive: add a study
     python registry.py stats                      Database statistics
-    python registry.py verify-dois [--category]   Batch-verify all DOIs against doi.org
+    python registry.py verify-dois [--category]   Batch-verify all DOIs against CrossRef/doi.org
 """
 
 import argparse
+import functools
+import heapq
+import html
+import itertools
 import json
+import multiprocessing
+import os
 import re
 import sys
+import threading
+import time
 import uuid
+import urllib.parse
 import urllib.request
 import urllib.error
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from pathlib import Path
+from types import MappingProxyType
 
-DATA_PATH = Path(__file__).parent / "studies.json"
-REGISTRY_MD = Path(__file__).parent / "study-registry.md"
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+DATA_PATH = SCRIPT_DIR / "studies.json"
+REGISTRY_MD = SCRIPT_DIR / "study-registry.md"
 
 
 # ─────────────────────────────────────────────
 # Data access
 # ─────────────────────────────────────────────
 
+@functools.lru_cache(maxsize=1)
+def _load_db_cached(path, mtime_ns):
+    """Decode studies.json once per (path, mtime); a save_db invalidates it."""
+    data = Path(path).read_bytes()
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data.decode('utf-8'))
+
+
 def load_db():
-    """Load studies.json, creating empty structure if missing."""
+    """Load studies.json, creating empty structure if missing.
+
+    Uses orjson when installed (bytes in, no str decode), else stdlib json.
+    Repeat loads in one process share the decoded dict until the file
+    changes, so callers that mutate it are expected to save_db()."""
     if DATA_PATH.exists():
-        return json.loads(DATA_PATH.read_text(encoding='utf-8'))
+        return _load_db_cached(str(DATA_PATH), DATA_PATH.stat().st_mtime_ns)
     return {'studies': [], 'claims': [], 'study_claims': [], 'evidence_usage': []}
 
 
 def save_db(db):
-    """Write studies.json."""
-    DATA_PATH.write_text(json.dumps(db, indent=2, ensure_ascii=False), encoding='utf-8')
+    """Write studies.json (same 2-space layout with or without orjson).
+
+    Written to a sibling temp file and swapped in with os.replace, so a crash
+    mid-write never leaves a truncated studies.json behind."""
+    db.pop('_idx', None)    # never persisted; stale once the caller has mutated db
+    if orjson is not None:
+        data = orjson.dumps(db, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    else:
+        data = json.dumps(db, indent=2, ensure_ascii=False).encode('utf-8')
+    tmp = DATA_PATH.with_suffix('.json.tmp')
+    tmp.write_bytes(data)
+    os.replace(tmp, DATA_PATH)
+
+
+def _build_indexes(db):
+    """Lookup dicts over a loaded db, built once and cached as db['_idx'].
+
+    Only valid until the db is mutated; save_db drops the cache."""
+    idx = db.get('_idx')
+    if idx is not None:
+        return idx
+    claims_by_study = defaultdict(list)
+    links_by_claim = defaultdict(list)
+    for sc in db['study_claims']:
+        claims_by_study[sc['study_id']].append(sc)
+        links_by_claim[sc['claim_id']].append(sc)
+    usage_by_study = defaultdict(list)
+    for eu in db['evidence_usage']:
+        usage_by_study[eu['study_id']].append(eu)
+    idx = db['_idx'] = {
+        'studies_by_id': {s['study_id']: s for s in db['studies']},
+        'study_order': {s['study_id']: i for i, s in enumerate(db['studies'])},
+        'claims_by_study': claims_by_study,
+        'links_by_claim': links_by_claim,
+        'usage_by_study': usage_by_study,
+        'study_id_by_doi': {s['doi']: s['study_id'] for s in db['studies'] if s.get('doi')},
+    }
+    return idx
 
 
 def uid():
@@ -65,26 +137,26 @@ def uid():
 # ─────────────────────────────────────────────
 
 def find_studies_for_claim(db, claim_id, direction=None):
-    """Return studies linked to a claim, sorted by final_score desc.
-    Each returned study dict gets an extra 'direction' key from the link."""
+    """Return (study, direction) pairs for a claim, sorted by final_score desc.
+    Direction comes from the study↔claim link; study dicts are not copied.
+    Reads only the claim's own links via the db index; ties keep file order."""
+    idx = _build_indexes(db)
     # Build map: study_id → direction from the link
     link_map = {lk['study_id']: lk.get('direction', '')
-                for lk in db['study_claims'] if lk['claim_id'] == claim_id}
-    results = []
-    for s in db['studies']:
-        if s['study_id'] in link_map:
-            enriched = dict(s)
-            enriched['direction'] = link_map[s['study_id']]
-            results.append(enriched)
-    if direction:
-        results = [s for s in results if s.get('direction') == direction]
-    results.sort(key=lambda s: s.get('final_score', 0), reverse=True)
+                for lk in idx['links_by_claim'].get(claim_id, ())}
+    by_id, order = idx['studies_by_id'], idx['study_order']
+    results = [(by_id[sid], d) for sid, d in link_map.items()
+               if sid in by_id and (not direction or d == direction)]
+    results.sort(key=lambda r: (-r[0].get('final_score', 0), order[r[0]['study_id']]))
     return results
 
 
+_NON_ALPHA_RE = re.compile(r'[^a-zA-Z]')
+
+
 def make_study_id(authors, year):
     author = authors.strip().strip('*').split(' ')[0].split('&')[0].strip()
-    author = re.sub(r'[^a-zA-Z]', '', author).lower()
+    author = _NON_ALPHA_RE.sub('', author).lower()
     return f"{author}-{year}-{uid()[:4]}"
 
 
@@ -92,9 +164,43 @@ def make_study_id(authors, year):
 # DOI validation
 # ─────────────────────────────────────────────
 
-def validate_doi(doi, expected_title=None, expected_authors=None, timeout=10):
+USER_AGENT = 'LongevityPath-Registry/1.0 (mailto:registry@longevitypath.org)'
+CROSSREF_API = 'https://api.crossref.org/works/'
+VERIFY_WORKERS = 8          # concurrent DOI lookups in verify-dois
+VERIFY_RATE = 10            # max request starts per second across all workers
+
+
+_NORM_RE = re.compile(r'[^a-z0-9]')
+
+
+def _normalize_title(title):
+    """Lowercase alphanumerics only, first 60 chars — for fuzzy title matching."""
+    return _NORM_RE.sub('', title.lower())[:60]
+
+
+def _fetch_json(url, accept, timeout):
+    req = urllib.request.Request(url, headers={'Accept': accept, 'User-Agent': USER_AGENT})
+    with urllib.request.urlopen(req, timeout=timeout) as resp:
+        return json.loads(resp.read().decode('utf-8'))
+
+
+def _crossref_lookup(doi, timeout=10):
+    """Fetch work metadata from the CrossRef REST API.
+
+    One hop to a CDN-fronted API (polite pool via mailto) instead of the
+    doi.org redirect chain to each publisher. Returns the CSL-like 'message'
+    dict; raises urllib.error.HTTPError (404) for DOIs CrossRef doesn't hold."""
+    url = f"{CROSSREF_API}{urllib.parse.quote(doi)}?mailto=registry@longevitypath.org"
+    return _fetch_json(url, 'application/json', timeout)['message']
+
+
+def validate_doi(doi, expected_title=None, expected_authors=None, timeout=10, use_crossref=False):
     """Validate a DOI by resolving it via doi.org content negotiation.
 
+    With use_crossref=True (bulk verification), the CrossRef REST API is tried
+    first and doi.org is only used for DOIs CrossRef returns 404 for
+    (e.g. DataCite-registered datasets).
+
     Returns dict with:
         valid: bool - DOI resolves to a real paper
         title_match: bool|None - title matches if expected_title given
@@ -116,15 +222,17 @@ def validate_doi(doi, expected_title=None, expected_authors=None, timeout=10):
     if doi.startswith('http://doi.org/'):
         doi = doi[len('http://doi.org/'):]
 
-    url = f'https://doi.org/{doi}'
-    req = urllib.request.Request(url, headers={
-        'Accept': 'application/vnd.citationstyles.csl+json',
-        'User-Agent': 'LongevityPath-Registry/1.0 (mailto:registry@longevitypath.org)'
-    })
-
     try:
-        with urllib.request.urlopen(req, timeout=timeout) as resp:
-            data = json.loads(resp.read().decode('utf-8'))
+        data = None
+        if use_crossref:
+            try:
+                data = _crossref_lookup(doi, timeout)
+            except urllib.error.HTTPError as e:
+                if e.code != 404:
+                    raise
+        if data is None:
+            data = _fetch_json(f'https://doi.org/{doi}',
+                               'application/vnd.citationstyles.csl+json', timeout)
     except urllib.error.HTTPError as e:
         if e.code == 404:
             result['error'] = f'DOI not found (404): {doi}'
@@ -154,17 +262,15 @@ def validate_doi(doi, expected_title=None, expected_authors=None, timeout=10):
 
     # Title comparison (fuzzy — normalize and compare first 40 chars)
     if expected_title:
-        def normalize(t):
-            return re.sub(r'[^a-z0-9]', '', t.lower())[:60]
-        n_expected = normalize(expected_title)
-        n_resolved = normalize(resolved_title)
+        n_expected = _normalize_title(expected_title)
+        n_resolved = _normalize_title(resolved_title)
         # Check if they share significant overlap
         result['title_match'] = (n_expected[:40] == n_resolved[:40]) or (n_expected in n_resolved) or (n_resolved in n_expected)
 
     return result
 
 
-def validate_study_doi(study, strict=True):
+def validate_study_doi(study, strict=True, use_crossref=False):
     """Validate a study's DOI and check title match.
 
     Returns (is_ok: bool, message: str)
@@ -176,7 +282,7 @@ def validate_study_doi(study, strict=True):
         return True, f"  ⚠ {study['study_id']}: No DOI (skipped)"
 
     title = study.get('title', '')
-    result = validate_doi(doi, expected_title=title)
+    result = validate_doi(doi, expected_title=title, use_crossref=use_crossref)
 
     if not result['valid']:
         return False, f"  ✗ {study['study_id']}: {result['error']}"
@@ -196,17 +302,34 @@ def validate_study_doi(study, strict=True):
 # verify-dois
 # ─────────────────────────────────────────────
 
+def _rate_limited(fn, per_second):
+    """Wrap fn so calls from any thread start at most per_second times a second."""
+    lock = threading.Lock()
+    interval = 1.0 / per_second
+    next_start = [0.0]
+
+    def wrapper(*a, **kw):
+        with lock:
+            now = time.monotonic()
+            wait = next_start[0] - now
+            next_start[0] = max(now, next_start[0]) + interval
+        if wait > 0:
+            time.sleep(wait)
+        return fn(*a, **kw)
+    return wrapper
+
+
 def cmd_verify_dois(args):
-    """Batch-verify all DOIs in studies.json against doi.org."""
-    import time
+    """Batch-verify all DOIs in studies.json against CrossRef (doi.org fallback).
 
+    Lookups run on a thread pool, throttled to VERIFY_RATE requests/s;
+    results are printed in study order."""
     db = load_db()
     category = getattr(args, 'category', None)
 
     # Filter by category if requested
     if category:
-        claim_ids = {c['claim_id'] for c in db['claims']
-                     if get_claim_category(c['claim_id']) == category}
+        claim_ids = claim_ids_in_category(db['claims'], category)
         study_ids = {sc['study_id'] for sc in db['study_claims']
                      if sc['claim_id'] in claim_ids}
         studies = [s for s in db['studies'] if s['study_id'] in study_ids]
@@ -219,28 +342,26 @@ def cmd_verify_dois(args):
     no_doi = []
     mismatched = []
 
-    print(f"\n  Verifying {total} study DOIs against doi.org...\n")
+    print(f"\n  Verifying {total} study DOIs against CrossRef/doi.org...\n")
 
-    for i, s in enumerate(studies, 1):
-        sid = s['study_id']
-        doi = s.get('doi', '')
-
-        if not doi:
-            no_doi.append(s)
-            print(f"  [{i}/{total}] ⚠ {sid}: No DOI")
-            continue
+    check = _rate_limited(
+        lambda s: validate_study_doi(s, strict=True, use_crossref=True), VERIFY_RATE)
+    with ThreadPoolExecutor(max_workers=VERIFY_WORKERS) as pool:
+        # map() yields in submission order while later lookups are in flight
+        results = pool.map(check, [s for s in studies if s.get('doi')])
 
-        # Rate-limit: ~1 request per second to be polite
-        if i > 1:
-            time.sleep(1.0)
+        for i, s in enumerate(studies, 1):
+            if not s.get('doi'):
+                no_doi.append(s)
+                print(f"  [{i}/{total}] ⚠ {s['study_id']}: No DOI")
+                continue
 
-        is_ok, msg = validate_study_doi(s, strict=True)
-        print(f"  [{i}/{total}] {msg.strip()}")
+            is_ok, msg = next(results)
+            print(f"  [{i}/{total}] {msg.strip()}")
 
-        if is_ok:
-            ok += 1
-        else:
-            if 'TITLE MISMATCH' in msg:
+            if is_ok:
+                ok += 1
+            elif 'TITLE MISMATCH' in msg:
                 mismatched.append((s, msg))
             else:
                 failed.append((s, msg))
@@ -289,7 +410,11 @@ def cmd_init(args):
 # ─────────────────────────────────────────────
 
 SECTION_PATTERN = re.compile(r'^## (.+)$')
-TABLE_ROW_PATTERN = re.compile(r'^\|(.+)\|$')
+CLAIM_TAG_RE = re.compile(r'`([^`]+→[^`]+)`')
+USED_SPLIT_RE = re.compile(r',\s*(?=[a-z])')
+ROLE_RE = re.compile(r'\(([FS])\)')
+PAGE_CARDS_RE = re.compile(r'([a-z0-9]+)#(.+)')
+CARD_RE = re.compile(r'q\d+')
 
 SECTION_TO_PAGE = {
     "Sleep": "sleep", "Mindset": "mindset", "Wellbeing": "wellbeing",
@@ -297,32 +422,43 @@ SECTION_TO_PAGE = {
     "Muscle Strength": "muscle",
 }
 
+# Markdown direction cell → canonical symbol (ASCII hyphen means minus)
+DIR_MAP = {'+': '+', '−': '−', '-': '−', '±': '±'}
+VOCAB_HEADER = '## Claim Tag Vocabulary'
+
+
+def split_table_row(line):
+    """Split a `| a | b |` markdown row into stripped cells, or None if not a row."""
+    if len(line) < 3 or line[0] != '|' or line[-1] != '|':
+        return None
+    return [c.strip() for c in line[1:-1].split('|')]
+
 
 def parse_claim_tags(claims_str):
-    return re.findall(r'`([^`]+→[^`]+)`', claims_str)
+    return CLAIM_TAG_RE.findall(claims_str)
 
 
 def parse_used_in(used_in_str, section_page):
     usages = []
     if not used_in_str or used_in_str.strip() == '—':
         return usages
-    parts = re.split(r',\s*(?=[a-z])', used_in_str.strip())
+    parts = USED_SPLIT_RE.split(used_in_str.strip())
     for part in parts:
         part = part.strip()
         if not part:
             continue
-        role_match = re.search(r'\(([FS])\)', part)
+        role_match = ROLE_RE.search(part)
         role = 'featured' if role_match and role_match.group(1) == 'F' else 'supporting'
-        part_clean = re.sub(r'\([FS]\)', '', part).strip()
-        page_match = re.match(r'([a-z0-9]+)#(.+)', part_clean)
+        part_clean = ROLE_RE.sub('', part).strip()
+        page_match = PAGE_CARDS_RE.match(part_clean)
         if page_match:
             page = page_match.group(1)
-            cards = re.findall(r'q\d+', page_match.group(2))
+            cards = CARD_RE.findall(page_match.group(2))
             page_file = f"{page}-evidence.html"
             for card in cards:
                 usages.append((page_file, card, role))
         else:
-            cards = re.findall(r'q\d+', part_clean)
+            cards = CARD_RE.findall(part_clean)
             page_file = f"{section_page}-evidence.html" if section_page else "unknown.html"
             for card in cards:
                 usages.append((page_file, card, role))
@@ -341,6 +477,43 @@ def parse_score(score_str):
     return (final, 1.0, final)
 
 
+# Row counts below this parse faster serially than a process pool can start
+IMPORT_POOL_MIN_ROWS = 2000
+
+
+def parse_study_row(row):
+    """Parse one (cells, section_page) study-table row.
+
+    Returns (study, claim_tags, usages). Pure apart from the random study-id
+    suffix, so import-md can fan rows out to a process pool."""
+    cells, section_page = row
+    authors = cells[0].strip('*').strip()
+    try:
+        pub_year = 2026 - int(cells[1].strip())
+    except ValueError:
+        pub_year = 2020
+    doi = cells[2].strip() if cells[2].strip().startswith('10.') else None
+    study_type = cells[3].strip()
+    sample = cells[4].strip() or None
+    q, r, f = parse_score(cells[5])
+    landmark = cells[6].strip().upper() == 'Y'
+    direction = DIR_MAP.get(cells[7], cells[7])
+    population = cells[8].strip() or 'all'
+    claims_str = cells[9].strip()
+    used_in_str = cells[10].strip()
+    notes = cells[11].strip() if len(cells) > 11 else ''
+
+    study = {
+        'study_id': make_study_id(authors, pub_year), 'authors': authors, 'pub_year': pub_year,
+        'doi': doi, 'study_type': study_type, 'sample_size': sample,
+        'quality_score': q, 'relevance_mult': r, 'final_score': f,
+        'is_landmark': landmark, 'direction': direction, 'population': population,
+        'key_finding': notes or None, 'verified_date': '2026-02',
+        'notes': notes or None,
+    }
+    return study, parse_claim_tags(claims_str), parse_used_in(used_in_str, section_page)
+
+
 def cmd_import_md(args):
     md_path = Path(args.file)
     if not md_path.exists():
@@ -348,117 +521,127 @@ def cmd_import_md(args):
         sys.exit(1)
 
     db = load_db()
-    existing_dois = {s['doi'] for s in db['studies'] if s.get('doi')}
+    # Local copy: DOIs staged mid-merge must not leak into the cached db['_idx']
+    study_id_by_doi = dict(_build_indexes(db)['study_id_by_doi'])
     existing_claims = {c['claim_id'] for c in db['claims']}
-    text = md_path.read_text(encoding='utf-8')
-    lines = text.splitlines()
-
-    studies_added = 0
+    new_claims = []
 
-    # Extract claim vocabulary
-    in_vocab = False
-    for line in lines:
-        if '## Claim Tag Vocabulary' in line:
-            in_vocab = True
-            continue
-        if in_vocab and line.startswith('## '):
-            break
-        if in_vocab and line.startswith('|'):
-            match = TABLE_ROW_PATTERN.match(line)
-            if match:
-                cells = [c.strip() for c in match.group(1).split('|')]
-                if len(cells) >= 2:
-                    tag = cells[0].strip().strip('`')
-                    desc = cells[1].strip()
-                    if '→' in tag and tag != 'Tag' and tag not in existing_claims:
-                        parts = tag.split('→', 1)
-                        db['claims'].append({
-                            'claim_id': tag, 'exposure': parts[0],
-                            'outcome': parts[1], 'description': desc
-                        })
-                        existing_claims.add(tag)
-
-    # Parse study tables
+    # One streamed pass: vocabulary rows are registered as they are seen,
+    # study rows are only collected. Claims named by study rows are added in
+    # the merge below, after the whole file (and so the vocabulary) is read.
+    rows = []
     current_section = None
     current_page = None
     in_removed = False
-
-    for line in lines:
-        sec_match = SECTION_PATTERN.match(line)
-        if sec_match:
-            name = sec_match.group(1).strip()
-            if name in SECTION_TO_PAGE:
-                current_section = name
-                current_page = SECTION_TO_PAGE[name]
-                in_removed = False
-            elif 'Removed' in name:
-                in_removed = True
-                current_section = None
-            else:
-                current_section = None
-                in_removed = False
-            continue
-
-        if not line.startswith('|') or in_removed or not current_section:
+    in_vocab = vocab_done = False
+
+    with open(md_path, encoding='utf-8') as md:
+        for line in md:
+            line = line.rstrip('\n')
+
+            # Claim vocabulary: the first vocabulary section only
+            if not vocab_done:
+                if VOCAB_HEADER in line:
+                    in_vocab = True
+                elif in_vocab and line.startswith('## '):
+                    in_vocab, vocab_done = False, True
+                elif in_vocab and line.startswith('|'):
+                    cells = split_table_row(line)
+                    if cells and len(cells) >= 2:
+                        tag = cells[0].strip().strip('`')
+                        desc = cells[1].strip()
+                        if '→' in tag and tag != 'Tag' and tag not in existing_claims:
+                            parts = tag.split('→', 1)
+                            new_claims.append({
+                                'claim_id': tag, 'exposure': parts[0],
+                                'outcome': parts[1], 'description': desc
+                            })
+                            existing_claims.add(tag)
+
+            sec_match = SECTION_PATTERN.match(line)
+            if sec_match:
+                name = sec_match.group(1).strip()
+                if name in SECTION_TO_PAGE:
+                    current_section = name
+                    current_page = SECTION_TO_PAGE[name]
+                    in_removed = False
+                elif 'Removed' in name:
+                    in_removed = True
+                    current_section = None
+                else:
+                    current_section = None
+                    in_removed = False
+                continue
+
+            if not line.startswith('|') or in_removed or not current_section:
+                continue
+            # Separator rows (|---|, | --- |) — reject before splitting
+            if line.startswith('|---') or line.startswith('| ---'):
+                continue
+
+            cells = split_table_row(line)
+            if not cells or cells[0].startswith('---') or cells[0] == 'Study':
+                continue
+            if len(cells) < 12:
+                continue
+            rows.append((cells, current_page))
+
+    if len(rows) >= IMPORT_POOL_MIN_ROWS:
+        with multiprocessing.Pool() as pool:
+            parsed = pool.map(parse_study_row, rows, chunksize=64)
+    else:
+        parsed = map(parse_study_row, rows)
+
+    # Merge serially: DOI dedup and claim/link bookkeeping depend on row order.
+    # Everything is staged and only applied to db once the whole file merged,
+    # so a failure part-way leaves db (and studies.json) untouched.
+    new_studies, new_links, new_usages, duplicates = [], [], [], []
+    # Usage ids are surrogate keys only: one random run prefix plus a counter
+    # gives the same 12-hex-char shape as uid() without a urandom read per row
+    run = uid()[:6]
+    usage_ids = (f"{run}{i:06x}" for i in itertools.count())
+    referenced_tags = {}    # insertion-ordered set of claim tags on kept rows
+    existing_links = {(lk['study_id'], lk['claim_id']) for lk in db['study_claims']}
+    for study, claim_tags, usages in parsed:
+        doi = study['doi']
+        if doi and doi in study_id_by_doi:
+            duplicates.append((study['authors'], doi, study_id_by_doi[doi]))
             continue
 
-        match = TABLE_ROW_PATTERN.match(line)
-        if not match:
-            continue
-        cells = [c.strip() for c in match.group(1).split('|')]
-        if not cells or cells[0].startswith('---') or cells[0] == 'Study':
-            continue
-        if len(cells) < 12:
-            continue
+        sid = study['study_id']
+        new_studies.append(study)
+        if doi:
+            study_id_by_doi[doi] = sid
 
-        authors = cells[0].strip('*').strip()
-        try:
-            pub_year = 2026 - int(cells[1].strip())
-        except ValueError:
-            pub_year = 2020
-        doi = cells[2].strip() if cells[2].strip().startswith('10.') else None
-        study_type = cells[3].strip()
-        sample = cells[4].strip() or None
-        q, r, f = parse_score(cells[5])
-        landmark = cells[6].strip().upper() == 'Y'
-        direction = {'+': '+', '−': '−', '-': '−', '±': '±'}.get(cells[7].strip(), cells[7].strip())
-        population = cells[8].strip() or 'all'
-        claims_str = cells[9].strip()
-        used_in_str = cells[10].strip()
-        notes = cells[11].strip() if len(cells) > 11 else ''
-
-        if doi and doi in existing_dois:
-            continue
+        for tag in claim_tags:
+            referenced_tags[tag] = None
+            if (sid, tag) not in existing_links:
+                existing_links.add((sid, tag))
+                new_links.append({'study_id': sid, 'claim_id': tag})
 
-        sid = make_study_id(authors, pub_year)
-        db['studies'].append({
-            'study_id': sid, 'authors': authors, 'pub_year': pub_year,
-            'doi': doi, 'study_type': study_type, 'sample_size': sample,
-            'quality_score': q, 'relevance_mult': r, 'final_score': f,
-            'landmark': landmark, 'direction': direction, 'population': population,
-            'key_finding': notes or None, 'verified_date': '2026-02',
-            'notes': notes or None,
-        })
-        if doi:
-            existing_dois.add(doi)
-        studies_added += 1
-
-        for tag in parse_claim_tags(claims_str):
-            if tag not in existing_claims:
-                parts = tag.split('→', 1)
-                db['claims'].append({'claim_id': tag, 'exposure': parts[0], 'outcome': parts[1], 'description': ''})
-                existing_claims.add(tag)
-            link = {'study_id': sid, 'claim_id': tag}
-            if link not in db['study_claims']:
-                db['study_claims'].append(link)
-
-        for page_file, card_id, role in parse_used_in(used_in_str, current_page):
-            db['evidence_usage'].append({
-                'id': uid(), 'study_id': sid, 'page_file': page_file,
+        for page_file, card_id, role in usages:
+            new_usages.append({
+                'id': next(usage_ids), 'study_id': sid, 'page_file': page_file,
                 'card_id': card_id, 'role': role
             })
 
+    # Claims named by study rows but absent from the db and the vocabulary,
+    # resolved with one set diff (kept in first-seen order)
+    missing = referenced_tags.keys() - existing_claims
+    for tag in referenced_tags:
+        if tag in missing:
+            exposure, _, outcome = tag.partition('→')
+            new_claims.append({'claim_id': tag, 'exposure': exposure, 'outcome': outcome, 'description': ''})
+    existing_claims |= missing
+
+    db['claims'].extend(new_claims)
+    db['studies'].extend(new_studies)
+    db['study_claims'].extend(new_links)
+    db['evidence_usage'].extend(new_usages)
+    studies_added = len(new_studies)
     save_db(db)
+    for authors, doi, existing_sid in duplicates:
+        print(f"  ⚠ Skipped {authors}: DOI {doi} already registered as {existing_sid}")
     print(f"✓ Import complete: {studies_added} studies, {len(existing_claims)} claims")
 
 
@@ -484,10 +667,10 @@ def cmd_query(args):
     print(f"  Claim: {args.claim}  ({len(results)} studies)")
     print(f"{'='*70}\n")
 
-    for s in results:
+    for s, d in results:
         lm = " ★" if s.get('is_landmark') else ""
         pop = f" [{s['population']}]" if s.get('population', 'all') != 'all' else ""
-        print(f"  {s.get('direction','')}  {s['authors']} {s['pub_year']}  "
+        print(f"  {d}  {s['authors']} {s['pub_year']}  "
               f"({s.get('study_type','')}, Score {s.get('final_score',0):.0f}{lm}){pop}")
         if s.get('key_finding'):
             print(f"     → {s['key_finding'][:100]}")
@@ -501,6 +684,14 @@ def cmd_query(args):
 # ─────────────────────────────────────────────
 
 def build_summary_data(db):
+    """Claim Summary Index rows, memoized in the db index (dropped on save)."""
+    idx = _build_indexes(db)
+    if 'summary' not in idx:
+        idx['summary'] = _summarize_claims(db)
+    return idx['summary']
+
+
+def _summarize_claims(db):
     summary = []
     claim_ids = sorted({c['claim_id'] for c in db['claims']})
     for cid in claim_ids:
@@ -508,12 +699,20 @@ def build_summary_data(db):
         if not studies:
             continue
 
-        plus = [s for s in studies if s.get('direction') == '+']
-        minus = [s for s in studies if s.get('direction') == '−']
-        mixed = [s for s in studies if s.get('direction') == '±']
-
-        best_plus = f"{plus[0]['authors']} {plus[0]['pub_year']} ({plus[0]['final_score']:.0f})" if plus else '—'
-        best_minus = f"{minus[0]['authors']} {minus[0]['pub_year']} ({minus[0]['final_score']:.0f})" if minus else '—'
+        # One pass over the claim's studies. They arrive score-sorted, so the
+        # first hit per direction is its best study and the head is the top.
+        counts = {'+': 0, '−': 0, '±': 0}
+        first = {}
+        for s, d in studies:
+            if d in counts:
+                counts[d] += 1
+                first.setdefault(d, s)
+        top = studies[0][0].get('final_score', 0)
+        plus, minus, mixed = counts['+'], counts['−'], counts['±']
+        bp_study, bm_study = first.get('+'), first.get('−')
+
+        best_plus = f"{bp_study['authors']} {bp_study['pub_year']} ({bp_study['final_score']:.0f})" if plus else '—'
+        best_minus = f"{bm_study['authors']} {bm_study['pub_year']} ({bm_study['final_score']:.0f})" if minus else '—'
 
         if plus and not minus and not mixed:
             net = '+'
@@ -522,11 +721,10 @@ def build_summary_data(db):
         elif mixed and not plus and not minus:
             net = '±'
         else:
-            bp = plus[0]['final_score'] if plus else 0
-            bm = minus[0]['final_score'] if minus else 0
+            bp = bp_study['final_score'] if plus else 0
+            bm = bm_study['final_score'] if minus else 0
             net = '+ (contested)' if bp >= bm else '− (contested)'
 
-        top = max(s.get('final_score', 0) for s in studies)
         confidence = 'Strong' if top >= 12 else 'Moderate' if top >= 10 else 'Limited'
 
         gap = ''
@@ -536,9 +734,10 @@ def build_summary_data(db):
             gap = 'Need supporting study'
 
         summary.append({
-            'claim': cid, 'n_plus': len(plus), 'n_minus': len(minus),
-            'n_mixed': len(mixed), 'best_plus': best_plus, 'best_minus': best_minus,
+            'claim': cid, 'n_plus': plus, 'n_minus': minus,
+            'n_mixed': mixed, 'best_plus': best_plus, 'best_minus': best_minus,
             'net': net, 'confidence': confidence, 'gap': gap,
+            '_category': get_claim_category(cid),
         })
     return summary
 
@@ -564,6 +763,26 @@ def cmd_summary(args):
 # export-summary
 # ─────────────────────────────────────────────
 
+SUMMARY_TABLE_HEADER = '| Claim | #+ |'
+
+
+def find_summary_table(md_lines):
+    """(start, end) line span of the Claim Summary Index table, or None.
+
+    The span covers the header, its separator and every following `|` row."""
+    for i, line in enumerate(md_lines):
+        if not line.startswith(SUMMARY_TABLE_HEADER):
+            continue
+        sep = md_lines[i + 1] if i + 1 < len(md_lines) else ''
+        if not sep.startswith('|') or sep.strip(' \t\n-|'):
+            continue
+        end = i + 2
+        while end < len(md_lines) and md_lines[end].startswith('|'):
+            end += 1
+        return i, end
+    return None
+
+
 def cmd_export_summary(args):
     db = load_db()
     summary = build_summary_data(db)
@@ -581,12 +800,12 @@ def cmd_export_summary(args):
             f"{s['best_plus']} | {s['best_minus']} | {s['net']} | {s['confidence']} | {s['gap']} |"
         )
 
-    text = REGISTRY_MD.read_text(encoding='utf-8')
-    pattern = re.compile(r'(\| Claim \| #\+ \|.*?\n\|[-|\s]+\n)((?:\|.*\n)*)', re.MULTILINE)
-    match = pattern.search(text)
-    if match:
-        text = text[:match.start()] + '\n'.join(lines) + '\n' + text[match.end():]
-        REGISTRY_MD.write_text(text, encoding='utf-8')
+    md_lines = REGISTRY_MD.read_text(encoding='utf-8').splitlines(keepends=True)
+    span = find_summary_table(md_lines)
+    if span:
+        start, end = span
+        md_lines[start:end] = [line + '\n' for line in lines]
+        REGISTRY_MD.write_text(''.join(md_lines), encoding='utf-8')
         print(f"✓ Updated study-registry.md ({len(summary)} claims)")
     else:
         print("✗ Could not find Claim Summary Index table")
@@ -604,11 +823,10 @@ def cmd_export_refs(args):
         claim_ids = sorted({lk['claim_id'] for lk in db['study_claims']})
         rows = []
         for cid in claim_ids:
-            for s in find_studies_for_claim(db, cid):
-                rows.append({**s, 'claim_id': cid})
+            for s, _ in find_studies_for_claim(db, cid):
+                rows.append((cid, s))
     else:
-        studies = find_studies_for_claim(db, args.claim)
-        rows = [{**s, 'claim_id': args.claim} for s in studies]
+        rows = [(args.claim, s) for s, _ in find_studies_for_claim(db, args.claim)]
 
     if not rows:
         print(f"No studies found for claim: {args.claim}", file=sys.stderr)
@@ -616,20 +834,20 @@ def cmd_export_refs(args):
 
     if args.json:
         out = []
-        for r in rows:
+        for cid, r in rows:
             out.append({
                 'authors': r['authors'], 'year': r['pub_year'], 'doi': r.get('doi'),
                 'studyType': r.get('study_type'), 'sampleSize': r.get('sample_size'),
                 'qualityScore': r.get('quality_score'), 'keyFinding': r.get('key_finding'),
-                'claim': r['claim_id'],
+                'claim': cid,
             })
         print(json.dumps(out, indent=2))
     else:
         current_claim = None
         ref_num = 0
-        for r in rows:
-            if r['claim_id'] != current_claim:
-                current_claim = r['claim_id']
+        for cid, r in rows:
+            if cid != current_claim:
+                current_claim = cid
                 ref_num = 0
                 print(f"\n--- {current_claim} ---\n")
 
@@ -728,18 +946,20 @@ def cmd_add(args):
         'study_id': sid, 'authors': authors, 'pub_year': pub_year,
         'doi': doi, 'title': title, 'study_type': study_type, 'sample_size': sample,
         'quality_score': quality, 'relevance_mult': relevance, 'final_score': final,
-        'landmark': landmark, 'direction': direction, 'population': population,
+        'is_landmark': landmark, 'direction': direction, 'population': population,
         'key_finding': finding, 'verified_date': datetime.now().strftime('%Y-%m'),
         'notes': None,
     })
 
+    # Stage new claims and links, then apply each with one extend
     existing_claims = {c['claim_id'] for c in db['claims']}
-    for tag in claim_tags:
+    new_claims = []
+    for tag in dict.fromkeys(claim_tags):
         if tag not in existing_claims:
-            parts = tag.split('→', 1)
-            db['claims'].append({'claim_id': tag, 'exposure': parts[0], 'outcome': parts[1], 'description': ''})
-            existing_claims.add(tag)
-        db['study_claims'].append({'study_id': sid, 'claim_id': tag})
+            exposure, outcome = tag.split('→', 1)
+            new_claims.append({'claim_id': tag, 'exposure': exposure, 'outcome': outcome, 'description': ''})
+    db['claims'].extend(new_claims)
+    db['study_claims'].extend({'study_id': sid, 'claim_id': tag} for tag in claim_tags)
 
     save_db(db)
     print(f"\n✓ Added: {authors} {pub_year} → {sid}")
@@ -755,12 +975,12 @@ def cmd_stats(args):
     db = load_db()
     studies = db['studies']
     # Count directions from study_claims links (not study-level)
-    dir_plus = sum(1 for sc in db['study_claims'] if sc.get('direction') == '+')
-    dir_minus = sum(1 for sc in db['study_claims'] if sc.get('direction') == '−')
-    dir_mixed = sum(1 for sc in db['study_claims'] if sc.get('direction') == '±')
-    landmarks = sum(1 for s in studies if s.get('is_landmark'))
-    with_doi = sum(1 for s in studies if s.get('doi'))
-    with_finding = sum(1 for s in studies if s.get('key_finding'))
+    dir_counts = Counter(sc.get('direction', '') for sc in db['study_claims'])
+    landmarks = with_doi = with_finding = 0
+    for s in studies:
+        landmarks += bool(s.get('is_landmark'))
+        with_doi += bool(s.get('doi'))
+        with_finding += bool(s.get('key_finding'))
 
     print(f"\n{'='*50}")
     print("  LongevityPath Evidence Registry")
@@ -768,9 +988,9 @@ def cmd_stats(args):
     print(f"  Studies:        {len(studies)}")
     print(f"    With DOI:     {with_doi}")
     print(f"    With finding: {with_finding}")
-    print(f"    Supporting:   {dir_plus}")
-    print(f"    Contradicting:{dir_minus}")
-    print(f"    Conditional:  {dir_mixed}")
+    print(f"    Supporting:   {dir_counts['+']}")
+    print(f"    Contradicting:{dir_counts['−']}")
+    print(f"    Conditional:  {dir_counts['±']}")
     print(f"    Landmarks:    {landmarks}")
     print(f"  Claims:         {len(db['claims'])}")
     print(f"  Study↔Claim:    {len(db['study_claims'])}")
@@ -800,14 +1020,29 @@ _CATEGORY_MAP = {
     'wellbeing': ['positive-affect', 'flow', 'social-connection', 'purpose', 'goal-pursuit',
                   'stress-mindset', 'emotion-regulation', 'meditation', 'nature', 'gratitude', 'PERMA'],
 }
+PREFIXES_BY_CATEGORY = {}
 for cat, prefixes in _CATEGORY_MAP.items():
-    for prefix in prefixes:
+    cat = sys.intern(cat)
+    PREFIXES_BY_CATEGORY[cat] = frozenset(map(sys.intern, prefixes))
+    for prefix in PREFIXES_BY_CATEGORY[cat]:
         CLAIM_TO_CATEGORY[prefix] = cat
+# Read-only from here on; lookups only
+CLAIM_TO_CATEGORY = MappingProxyType(CLAIM_TO_CATEGORY)
+PREFIXES_BY_CATEGORY = MappingProxyType(PREFIXES_BY_CATEGORY)
 
 
 def get_claim_category(claim_id):
-    exposure = claim_id.split('→')[0] if '→' in claim_id else claim_id
-    return CLAIM_TO_CATEGORY.get(exposure, 'other')
+    return CLAIM_TO_CATEGORY.get(claim_id.partition('→')[0], 'other')
+
+
+def claim_ids_in_category(claims, category):
+    """Set of claim_ids whose exposure prefix maps to *category*."""
+    prefixes = PREFIXES_BY_CATEGORY.get(category)
+    if prefixes is None:
+        return {c['claim_id'] for c in claims
+                if get_claim_category(c['claim_id']) == category}
+    return {c['claim_id'] for c in claims
+            if c['claim_id'].partition('→')[0] in prefixes}
 
 
 def cmd_gaps(args):
@@ -815,10 +1050,13 @@ def cmd_gaps(args):
     category = getattr(args, 'category', None)
     summary = build_summary_data(db)
 
-    if category:
-        summary = [s for s in summary if get_claim_category(s['claim']) == category]
-
-    weak = [s for s in summary if s['n_plus'] < 2 or s['n_minus'] == 0]
+    total, weak = 0, []
+    for s in summary:
+        if category and s['_category'] != category:
+            continue
+        total += 1
+        if s['n_plus'] < 2 or s['n_minus'] == 0:
+            weak.append(s)
     if not weak:
         print("✓ No evidence gaps found.")
         return
@@ -837,7 +1075,7 @@ def cmd_gaps(args):
             gaps.append("Need contradicting study")
         gap_str = '; '.join(gaps)
         print(f"  {s['claim']:<35} {s['n_plus']:>3} {s['n_minus']:>3}  {s['confidence']:<12} {gap_str}")
-    print(f"\n  Total gaps: {len(weak)} / {len(summary)} claims\n")
+    print(f"\n  Total gaps: {len(weak)} / {total} claims\n")
 
 
 # ─────────────────────────────────────────────
@@ -847,8 +1085,9 @@ def cmd_gaps(args):
 def cmd_supersede(args):
     db = load_db()
     old_id, new_id = args.old_id, args.new_id
-    old_study = next((s for s in db['studies'] if s['study_id'] == old_id), None)
-    new_study = next((s for s in db['studies'] if s['study_id'] == new_id), None)
+    studies_by_id = _build_indexes(db)['studies_by_id']
+    old_study = studies_by_id.get(old_id)
+    new_study = studies_by_id.get(new_id)
     if not old_study:
         print(f"✗ Old study not found: {old_id}")
         sys.exit(1)
@@ -865,17 +1104,13 @@ def cmd_supersede(args):
 # enrich-all
 # ─────────────────────────────────────────────
 
-REQUIRED_FIELDS = ['title', 'journal', 'doi', 'study_type', 'key_finding', 'effect_sizes']
+REQUIRED_FIELDS = ('title', 'journal', 'doi', 'study_type', 'key_finding', 'effect_sizes')
 
 def cmd_enrich_all(args):
     db = load_db()
     incomplete = []
     for s in db['studies']:
-        missing = []
-        for f in REQUIRED_FIELDS:
-            val = s.get(f)
-            if val is None or val == '' or (isinstance(val, list) and len(val) == 0 and f == 'effect_sizes'):
-                missing.append(f)
+        missing = [f for f in REQUIRED_FIELDS if not s.get(f)]
         if missing:
             incomplete.append((s, missing))
 
@@ -883,8 +1118,14 @@ def cmd_enrich_all(args):
         print("✓ All studies have complete required fields.")
         return
 
-    incomplete.sort(key=lambda x: len(x[1]), reverse=True)
-    print(f"\n⚠ {len(incomplete)} studies with incomplete fields:\n")
+    n_incomplete = len(incomplete)
+    top = getattr(args, 'top', None)
+    if top:
+        # Worst offenders only: O(N log k) instead of a full sort
+        incomplete = heapq.nlargest(top, incomplete, key=lambda x: len(x[1]))
+    else:
+        incomplete.sort(key=lambda x: len(x[1]), reverse=True)
+    print(f"\n⚠ {n_incomplete} studies with incomplete fields:\n")
     for s, missing in incomplete:
         print(f"  {s['authors']:<25} {s['pub_year']}  Missing: {', '.join(missing)}")
     print(f"\n  Required fields: {', '.join(REQUIRED_FIELDS)}")
@@ -894,123 +1135,193 @@ def cmd_enrich_all(args):
 # export-xlsx
 # ─────────────────────────────────────────────
 
-def cmd_export_xlsx(args):
+XLSX_HEADERS = [
+    'Study ID', 'Authors', 'Year', 'Title', 'Journal', 'DOI',
+    'Study Type', 'Sample Size', 'Population', 'Country',
+    'Quality Score', 'Risk of Bias', 'GRADE', 'Direction',
+    'Status', 'Key Finding', 'Effect Sizes',
+    'Claims', 'Evidence Cards', 'Verified', 'Next Review', 'Notes'
+]
+XLSX_WIDTHS = {1:18, 2:18, 3:6, 4:45, 5:22, 6:25, 7:18, 8:12, 9:18, 10:10,
+               11:8, 12:12, 13:10, 14:6, 15:10, 16:50, 17:50, 18:30, 19:25, 20:10, 21:10, 22:30}
+XLSX_DIR_COLORS = {'+': 'C6F6D5', '−': 'FED7D7', '±': 'FFF3CD'}
+XLSX_STATUS_COLORS = {'active': 'FFFFFF', 'superseded': 'F8D7DA', 'retracted': 'F5C6CB'}
+XLSX_DOI_COL, XLSX_DIR_COL = 5, 13   # 0-based positions in XLSX_HEADERS
+# 1-based column letters; the sheet is narrower than 26 columns, so A..Z suffices
+XLSX_COL_LETTERS = [None] + [chr(ord('A') + i) for i in range(len(XLSX_HEADERS))]
+
+
+def _fmt_effect(e):
+    return (f"{e.get('metric', '')} {e.get('value', '')} "
+            f"[{e.get('ci_lower', '')},{e.get('ci_upper', '')}] {e.get('comparison', '')[:50]}")
+
+
+def xlsx_row_values(s, claims_by_study, usage_by_study):
+    """Cell values for one study row, in XLSX_HEADERS order."""
+    sid = s['study_id']
+    effects = s.get('effect_sizes')
+    effect_str = '; '.join(map(_fmt_effect, effects)) if effects else ''
+    return [
+        s['study_id'], s.get('authors_short') or s.get('authors', ''),
+        s.get('pub_year', ''), s.get('title', ''), s.get('journal', ''),
+        s.get('doi', ''), s.get('study_type', ''), s.get('sample_size', ''),
+        s.get('population', ''), s.get('country', ''),
+        s.get('quality_score', ''), s.get('risk_of_bias', ''),
+        s.get('grade_certainty', ''), s.get('direction', ''),
+        s.get('status', 'active'), s.get('key_finding', ''),
+        effect_str,
+        ', '.join(f"{sc.get('direction', '')} {sc['claim_id']}"
+                  for sc in claims_by_study.get(sid, ())),
+        ', '.join(f"{eu.get('evidence_page', '')}#{eu.get('card_id', '')}"
+                  for eu in usage_by_study.get(sid, ())),
+        s.get('verified_date', ''), s.get('next_review_date', ''),
+        s.get('notes', ''),
+    ]
+
+
+def write_xlsx_openpyxl(out_path, title, studies, claims_by_study, usage_by_study):
     try:
         import openpyxl
+        from openpyxl.cell import WriteOnlyCell
         from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
-        from openpyxl.utils import get_column_letter
     except ImportError:
         print("✗ openpyxl not installed. Run: pip install openpyxl")
         sys.exit(1)
 
-    db = load_db()
-    category = getattr(args, 'category', None)
+    # Write-only workbook: rows stream to the zip as they are appended
+    wb = openpyxl.Workbook(write_only=True)
+    ws = wb.create_sheet(title=title)
 
-    # Filter studies by category via evidence_usage or study_claims
-    if category:
-        usage_ids = {eu['study_id'] for eu in db['evidence_usage']
-                     if eu.get('evidence_page') == category}
-        claim_ids = {c['claim_id'] for c in db['claims']
-                     if get_claim_category(c['claim_id']) == category}
-        claim_study_ids = {sc['study_id'] for sc in db['study_claims']
-                          if sc['claim_id'] in claim_ids}
-        target_ids = usage_ids | claim_study_ids
-        studies = [s for s in db['studies'] if s['study_id'] in target_ids]
-    else:
-        studies = db['studies']
-
-    studies.sort(key=lambda s: (-s.get('final_score', 0), s.get('pub_year', 0)))
+    # Sheet layout must be set before the first row is streamed
+    for col, w in XLSX_WIDTHS.items():
+        ws.column_dimensions[XLSX_COL_LETTERS[col]].width = w
 
-    wb = openpyxl.Workbook()
-    ws = wb.active
-    ws.title = f"Evidence {'— ' + category if category else 'All'}"
-
-    headers = [
-        'Study ID', 'Authors', 'Year', 'Title', 'Journal', 'DOI',
-        'Study Type', 'Sample Size', 'Population', 'Country',
-        'Quality Score', 'Risk of Bias', 'GRADE', 'Direction',
-        'Status', 'Key Finding', 'Effect Sizes',
-        'Claims', 'Evidence Cards', 'Verified', 'Next Review', 'Notes'
-    ]
+    ws.freeze_panes = 'A2'
+    ws.auto_filter.ref = f'A1:{XLSX_COL_LETTERS[-1]}{len(studies)+1}'
 
     hfill = PatternFill('solid', fgColor='1B4332')
     hfont = Font(bold=True, color='FFFFFF', size=10, name='Arial')
     dfont = Font(size=9.5, name='Arial')
+    doi_font = Font(size=9.5, name='Arial', color='0563C1', underline='single')
+    dir_fills = {d: PatternFill('solid', fgColor=c) for d, c in XLSX_DIR_COLORS.items()}
+    status_fills = {st: PatternFill('solid', fgColor=c) for st, c in XLSX_STATUS_COLORS.items()
+                    if st != 'active'}
     wrap = Alignment(wrap_text=True, vertical='top')
     border = Border(
         left=Side(style='thin', color='D0D0D0'), right=Side(style='thin', color='D0D0D0'),
         top=Side(style='thin', color='D0D0D0'), bottom=Side(style='thin', color='D0D0D0')
     )
 
-    for col, h in enumerate(headers, 1):
-        cell = ws.cell(row=1, column=col, value=h)
-        cell.font = hfont; cell.fill = hfill; cell.alignment = wrap; cell.border = border
+    def styled(value, font=dfont, fill=None):
+        cell = WriteOnlyCell(ws, value=value)
+        cell.font = font; cell.alignment = wrap; cell.border = border
+        if fill is not None:
+            cell.fill = fill
+        return cell
+
+    ws.append([styled(h, hfont, hfill) for h in XLSX_HEADERS])
+
+    for s in studies:
+        # Status color fills the whole row and overrides the direction color
+        row_fill = status_fills.get(s.get('status', 'active'))
+        row = [styled(val, fill=row_fill)
+               for val in xlsx_row_values(s, claims_by_study, usage_by_study)]
+        if row_fill is None:
+            dir_fill = dir_fills.get(s.get('direction', ''))
+            if dir_fill is not None:
+                row[XLSX_DIR_COL].fill = dir_fill
 
-    # Build lookups
-    study_claims = {}
-    for sc in db['study_claims']:
-        study_claims.setdefault(sc['study_id'], []).append(
-            f"{sc.get('direction', '')} {sc['claim_id']}")
-    study_usage = {}
-    for eu in db['evidence_usage']:
-        study_usage.setdefault(eu['study_id'], []).append(
-            f"{eu.get('evidence_page', '')}#{eu.get('card_id', '')}")
+        # Hyperlink DOI
+        if s.get('doi'):
+            row[XLSX_DOI_COL].hyperlink = f"https://doi.org/{s['doi']}"
+            row[XLSX_DOI_COL].font = doi_font
 
-    dir_colors = {'+': 'C6F6D5', '−': 'FED7D7', '±': 'FFF3CD'}
-    status_colors = {'active': 'FFFFFF', 'superseded': 'F8D7DA', 'retracted': 'F5C6CB'}
+        ws.append(row)
 
-    for i, s in enumerate(studies, 1):
-        row = i + 1
-        effect_str = '; '.join(
-            f"{e.get('metric','')} {e.get('value','')} [{e.get('ci_lower','')},{e.get('ci_upper','')}] {e.get('comparison','')[:50]}"
-            for e in (s.get('effect_sizes') or [])
-        )
-        values = [
-            s['study_id'], s.get('authors_short') or s.get('authors', ''),
-            s.get('pub_year', ''), s.get('title', ''), s.get('journal', ''),
-            s.get('doi', ''), s.get('study_type', ''), s.get('sample_size', ''),
-            s.get('population', ''), s.get('country', ''),
-            s.get('quality_score', ''), s.get('risk_of_bias', ''),
-            s.get('grade_certainty', ''), s.get('direction', ''),
-            s.get('status', 'active'), s.get('key_finding', ''),
-            effect_str,
-            ', '.join(study_claims.get(s['study_id'], [])),
-            ', '.join(study_usage.get(s['study_id'], [])),
-            s.get('verified_date', ''), s.get('next_review_date', ''),
-            s.get('notes', ''),
-        ]
-        for col, val in enumerate(values, 1):
-            cell = ws.cell(row=row, column=col, value=val)
-            cell.font = dfont; cell.alignment = wrap; cell.border = border
-
-        # Color direction
-        d = s.get('direction', '')
-        if d in dir_colors:
-            ws.cell(row=row, column=14).fill = PatternFill('solid', fgColor=dir_colors[d])
+    wb.save(str(out_path))
 
-        # Color status
+
+def write_xlsx_xlsxwriter(out_path, title, studies, claims_by_study, usage_by_study):
+    """Same sheet as write_xlsx_openpyxl via xlsxwriter's constant-memory mode."""
+    try:
+        import xlsxwriter
+    except ImportError:
+        print("✗ xlsxwriter not installed. Run: pip install xlsxwriter")
+        sys.exit(1)
+
+    wb = xlsxwriter.Workbook(str(out_path), {'constant_memory': True, 'strings_to_urls': False})
+    ws = wb.add_worksheet(title)
+
+    base = {'font_name': 'Arial', 'font_size': 9.5, 'text_wrap': True, 'valign': 'top',
+            'border': 1, 'border_color': '#D0D0D0'}
+    hfmt = wb.add_format({**base, 'font_size': 10, 'bold': True, 'font_color': '#FFFFFF',
+                          'bg_color': '#1B4332'})
+    # xlsxwriter formats must be created once and reused: one per (fill, is_link)
+    formats = {}
+
+    def fmt(fill=None, link=False):
+        key = (fill, link)
+        if key not in formats:
+            props = dict(base)
+            if fill:
+                props['bg_color'] = f'#{fill}'
+            if link:
+                props.update(font_color='#0563C1', underline=1)
+            formats[key] = wb.add_format(props)
+        return formats[key]
+
+    for col, w in XLSX_WIDTHS.items():
+        ws.set_column(col - 1, col - 1, w)
+    ws.freeze_panes(1, 0)
+    ws.autofilter(0, 0, len(studies), len(XLSX_HEADERS) - 1)
+
+    ws.write_row(0, 0, XLSX_HEADERS, hfmt)
+
+    for r, s in enumerate(studies, 1):
+        values = xlsx_row_values(s, claims_by_study, usage_by_study)
         st = s.get('status', 'active')
-        if st in status_colors and st != 'active':
-            for col in range(1, len(headers) + 1):
-                ws.cell(row=row, column=col).fill = PatternFill('solid', fgColor=status_colors[st])
+        row_fill = XLSX_STATUS_COLORS[st] if st in XLSX_STATUS_COLORS and st != 'active' else None
+        ws.write_row(r, 0, values, fmt(row_fill))
+
+        # Status color wins over direction color, as in the openpyxl path
+        d = s.get('direction', '')
+        if row_fill is None and d in XLSX_DIR_COLORS:
+            ws.write(r, XLSX_DIR_COL, values[XLSX_DIR_COL], fmt(XLSX_DIR_COLORS[d]))
 
-        # Hyperlink DOI
         if s.get('doi'):
-            cell = ws.cell(row=row, column=6)
-            cell.hyperlink = f"https://doi.org/{s['doi']}"
-            cell.font = Font(size=9.5, name='Arial', color='0563C1', underline='single')
+            ws.write_url(r, XLSX_DOI_COL, f"https://doi.org/{s['doi']}", fmt(row_fill, link=True),
+                         string=s['doi'])
 
-    widths = {1:18, 2:18, 3:6, 4:45, 5:22, 6:25, 7:18, 8:12, 9:18, 10:10,
-              11:8, 12:12, 13:10, 14:6, 15:10, 16:50, 17:50, 18:30, 19:25, 20:10, 21:10, 22:30}
-    for col, w in widths.items():
-        ws.column_dimensions[get_column_letter(col)].width = w
+    wb.close()
 
-    ws.freeze_panes = 'A2'
-    ws.auto_filter.ref = f'A1:{get_column_letter(len(headers))}{len(studies)+1}'
 
+def cmd_export_xlsx(args):
+    db = load_db()
+    category = getattr(args, 'category', None)
+
+    # Filter studies by category via evidence_usage or study_claims
+    if category:
+        usage_ids = {eu['study_id'] for eu in db['evidence_usage']
+                     if eu.get('evidence_page') == category}
+        claim_ids = claim_ids_in_category(db['claims'], category)
+        claim_study_ids = {sc['study_id'] for sc in db['study_claims']
+                          if sc['claim_id'] in claim_ids}
+        target_ids = usage_ids | claim_study_ids
+        selected = (s for s in db['studies'] if s['study_id'] in target_ids)
+    else:
+        selected = db['studies']
+
+    # One list of references, built by sorted() straight from the filter;
+    # db['studies'] (possibly the cached load) is left in file order.
+    studies = sorted(selected, key=lambda s: (-s.get('final_score', 0), s.get('pub_year', 0)))
+
+    idx = _build_indexes(db)
+
+    title = f"Evidence {'— ' + category if category else 'All'}"
     suffix = f'-{category}' if category else ''
-    out_path = Path(__file__).parent.parent / f'evidence-registry{suffix}.xlsx'
-    wb.save(str(out_path))
+    out_path = SCRIPT_DIR.parent / f'evidence-registry{suffix}.xlsx'
+    writer = write_xlsx_xlsxwriter if getattr(args, 'fast', False) else write_xlsx_openpyxl
+    writer(out_path, title, studies, idx['claims_by_study'], idx['usage_by_study'])
     print(f"✓ Exported {len(studies)} studies to {out_path}")
 
 
@@ -1018,8 +1329,49 @@ def cmd_export_xlsx(args):
 # import-refs
 # ─────────────────────────────────────────────
 
+_REF_RE = re.compile(r'\[(\d+)\]\s*(.*?)(?=<\/div>)', re.DOTALL)
+_DOI_RE = re.compile(r'href="https://doi\.org/([^"]+)"')
+_TAG_RE = re.compile(r'<[^>]+>')
+_AUTH_RE = re.compile(r'^(.*?)\s*\(\d{4}\)')
+_YEAR_RE = re.compile(r'\((\d{4})\)')
+_TITLE_RE = re.compile(r'"([^"]+)"')
+_REF_NUM_RE = re.compile(r'\[(\d+)\]\s*')
+DOI_URL_PREFIX = 'https://doi.org/'
+
+
+def iter_refs(ref_html):
+    """Yield (text, doi, title) for each numbered [N] ref in a studyRefs blob.
+
+    Parses with selectolax (lexbor) when installed: one pass over the innermost
+    <div>s. Falls back to the regex scan otherwise. Either way text, doi and
+    title come from the tag-stripped, entity-decoded ref, so both backends
+    store the same values."""
+    if LexborHTMLParser is None:
+        for _, ref_text in _REF_RE.findall(ref_html):
+            doi_match = _DOI_RE.search(ref_text)
+            clean = html.unescape(_TAG_RE.sub('', ref_text)).strip()
+            title_match = _TITLE_RE.search(clean)
+            yield (clean,
+                   html.unescape(doi_match.group(1)) if doi_match else None,
+                   title_match.group(1) if title_match else '')
+        return
+
+    for node in LexborHTMLParser(ref_html).css('div'):
+        if len(node.css('div')) > 1:     # css() includes the node itself
+            continue
+        text = node.text(deep=True)
+        num = _REF_NUM_RE.search(text)
+        if not num:
+            continue
+        clean = text[num.end():].strip()
+        link = node.css_first(f'a[href^="{DOI_URL_PREFIX}"]')
+        doi = link.attributes.get('href', '')[len(DOI_URL_PREFIX):] if link else ''
+        title_match = _TITLE_RE.search(clean)
+        yield clean, doi or None, title_match.group(1) if title_match else ''
+
+
 def cmd_import_refs(args):
-    evidence_dir = Path(__file__).parent / 'evidence-pages'
+    evidence_dir = SCRIPT_DIR / 'evidence-pages'
     page_name = args.page
     json_path = evidence_dir / f'{page_name}.json'
     if not json_path.exists():
@@ -1030,33 +1382,34 @@ def cmd_import_refs(args):
 
     data = json.loads(json_path.read_text(encoding='utf-8'))
     db = load_db()
-    existing_dois = {s['doi'] for s in db['studies'] if s.get('doi')}
-    added = 0
+    idx = _build_indexes(db)
+    study_id_by_doi = dict(idx['study_id_by_doi'])  # staged DOIs stay out of db['_idx']
+    existing_ids = set(idx['studies_by_id'])
+    new_studies, lines = [], []
+    now = datetime.now()
+    verified_date, added_date = now.strftime('%Y-%m'), now.strftime('%Y-%m-%d')
 
     for card in data.get('cards', []):
         for ref_html in card.get('studyRefs', []):
-            refs = re.findall(r'\[(\d+)\]\s*(.*?)(?=<\/div>)', ref_html, re.DOTALL)
-            for ref_num, ref_text in refs:
-                # Extract DOI
-                doi_match = re.search(r'href="https://doi\.org/([^"]+)"', ref_text)
-                doi = doi_match.group(1) if doi_match else None
-                if doi and doi in existing_dois:
+            for clean, doi, title in iter_refs(ref_html):
+                if doi and doi in study_id_by_doi:
                     continue
 
-                # Extract authors
-                clean = re.sub(r'<[^>]+>', '', ref_text).strip()
-                authors_match = re.search(r'^(.*?)\s*\(\d{4}\)', clean)
+                authors_match = _AUTH_RE.search(clean)
                 authors = authors_match.group(1).strip().rstrip(',').strip() if authors_match else ''
                 authors = authors.replace('&amp;', '&')
 
-                year_match = re.search(r'\((\d{4})\)', clean)
+                year_match = _YEAR_RE.search(clean)
                 year = int(year_match.group(1)) if year_match else 2020
 
-                title_match = re.search(r'"([^"]+)"', ref_text)
-                title = title_match.group(1) if title_match else ''
-
                 sid = make_study_id(authors, year)
-                db['studies'].append({
+                if sid in existing_ids:
+                    n = 2
+                    while f"{sid}-{n}" in existing_ids:
+                        n += 1
+                    sid = f"{sid}-{n}"
+                existing_ids.add(sid)
+                new_studies.append({
                     'study_id': sid, 'authors': authors,
                     'authors_short': authors if len(authors) < 30 else authors[:30],
                     'pub_year': year, 'title': title, 'doi': doi,
@@ -1065,17 +1418,18 @@ def cmd_import_refs(args):
                     'is_landmark': False, 'direction': '+',
                     'relevance': 1.0, 'final_score': 0,
                     'key_finding': '', 'status': 'active',
-                    'verified_date': datetime.now().strftime('%Y-%m'),
-                    'added_date': datetime.now().strftime('%Y-%m-%d'),
+                    'verified_date': verified_date,
+                    'added_date': added_date,
                     'notes': f'Auto-imported from {page_name}.json card {card["id"]}',
                 })
                 if doi:
-                    existing_dois.add(doi)
-                added += 1
-                print(f"  + {authors} ({year}) from {card['id']}")
+                    study_id_by_doi[doi] = sid
+                lines.append(f"  + {authors} ({year}) from {card['id']}\n")
 
+    db['studies'].extend(new_studies)
     save_db(db)
-    print(f"\n✓ Imported {added} new studies from {page_name}.json")
+    sys.stdout.write(''.join(lines))
+    print(f"\n✓ Imported {len(new_studies)} new studies from {page_name}.json")
 
 
 # ─────────────────────────────────────────────
@@ -1089,47 +1443,50 @@ def main():
     )
     sub = parser.add_subparsers(dest='command', help='Available commands')
 
-    sub.add_parser('init', help='Create empty studies.json')
+    sub.add_parser('init', help='Create empty studies.json').set_defaults(func=cmd_init)
     p_import = sub.add_parser('import-md', help='Import from study-registry.md')
     p_import.add_argument('file', help='Path to study-registry.md')
+    p_import.set_defaults(func=cmd_import_md)
     p_query = sub.add_parser('query', help='Query studies by claim')
     p_query.add_argument('claim', help='Claim tag (e.g., protein→cancer)')
     p_query.add_argument('--dir', help='Filter by direction (+/−/±)')
-    sub.add_parser('summary', help='Print Claim Summary Index')
-    sub.add_parser('export-summary', help='Write Claim Summary Index to study-registry.md')
+    p_query.set_defaults(func=cmd_query)
+    sub.add_parser('summary', help='Print Claim Summary Index').set_defaults(func=cmd_summary)
+    sub.add_parser('export-summary', help='Write Claim Summary Index to study-registry.md'
+                   ).set_defaults(func=cmd_export_summary)
     p_refs = sub.add_parser('export-refs', help='Export builder-ready study refs')
     p_refs.add_argument('claim', help='Claim tag or "all"')
     p_refs.add_argument('--json', action='store_true', help='Output as JSON')
-    sub.add_parser('stale', help='List studies needing re-verification')
+    p_refs.set_defaults(func=cmd_export_refs)
+    sub.add_parser('stale', help='List studies needing re-verification').set_defaults(func=cmd_stale)
     p_gaps = sub.add_parser('gaps', help='Show claims with weak or missing evidence')
     p_gaps.add_argument('--category', help='Filter by category (sleep, nutrition, etc.)')
+    p_gaps.set_defaults(func=cmd_gaps)
     p_supersede = sub.add_parser('supersede', help='Mark a study as superseded')
     p_supersede.add_argument('old_id', help='Study ID to mark as superseded')
     p_supersede.add_argument('new_id', help='Study ID of the replacement')
-    sub.add_parser('enrich-all', help='List studies with incomplete fields')
+    p_supersede.set_defaults(func=cmd_supersede)
+    p_enrich = sub.add_parser('enrich-all', help='List studies with incomplete fields')
+    p_enrich.add_argument('--top', type=int, help='Show only the N most incomplete studies')
+    p_enrich.set_defaults(func=cmd_enrich_all)
     p_xlsx = sub.add_parser('export-xlsx', help='Export studies to xlsx')
     p_xlsx.add_argument('category', nargs='?', help='Category to export (or all)')
+    p_xlsx.add_argument('--fast', action='store_true', help='Write with xlsxwriter (constant memory)')
+    p_xlsx.set_defaults(func=cmd_export_xlsx)
     p_irefs = sub.add_parser('import-refs', help='Import studies from evidence page JSON')
     p_irefs.add_argument('page', help='Evidence page name (e.g., sleep, nutrition-principles)')
-    sub.add_parser('add', help='Interactively add a new study')
-    sub.add_parser('stats', help='Show statistics')
-    p_vdoi = sub.add_parser('verify-dois', help='Batch-verify all DOIs against doi.org')
+    p_irefs.set_defaults(func=cmd_import_refs)
+    sub.add_parser('add', help='Interactively add a new study').set_defaults(func=cmd_add)
+    sub.add_parser('stats', help='Show statistics').set_defaults(func=cmd_stats)
+    p_vdoi = sub.add_parser('verify-dois', help='Batch-verify all DOIs against CrossRef/doi.org')
     p_vdoi.add_argument('--category', help='Filter by category (sleep, nutrition, etc.)')
+    p_vdoi.set_defaults(func=cmd_verify_dois)
 
     args = parser.parse_args()
     if not args.command:
         parser.print_help()
         sys.exit(1)
-
-    commands = {
-        'init': cmd_init, 'import-md': cmd_import_md, 'query': cmd_query,
-        'summary': cmd_summary, 'export-summary': cmd_export_summary,
-        'export-refs': cmd_export_refs, 'stale': cmd_stale, 'add': cmd_add,
-        'stats': cmd_stats, 'gaps': cmd_gaps, 'supersede': cmd_supersede,
-        'enrich-all': cmd_enrich_all, 'export-xlsx': cmd_export_xlsx,
-        'import-refs': cmd_import_refs, 'verify-dois': cmd_verify_dois,
-    }
-    commands[args.command](args)
+    args.func(args)
 
 
 if __name__ == '__main__':
@@ -0,0 +1,45 @@
+"""Tests for registry.py helpers."""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import registry  # noqa: E402
+
+# Same layout as evidence-builder.py's resolve_study_refs_html()
+REFS_BLOB = (
+    '<div class="study-refs-label">References</div>\n'
+    '                    <div class="study-ref">[1] Smith &amp; Jones (2019). "Sleep &amp; mortality"'
+    ' J Sleep, 3, 1-2. doi:<a href="https://doi.org/10.1/a" target="_blank">10.1/a</a></div>\n'
+    '                    <div class="study-ref">[2] Doe et al. (2020). Lancet.'
+    ' doi:<a href="https://doi.org/10.2/x" target="_blank">10.2/x</a></div>\n'
+    '                    <div class="study-ref">[3] <!-- Study not found: foo-2020 --></div>\n'
+    '                    <div class="study-ref">[4] Lee (2021). "Untitled &lt;draft&gt;".</div>\n'
+)
+
+
+EXPECTED_REFS = [
+    ('Smith & Jones (2019). "Sleep & mortality" J Sleep, 3, 1-2. doi:10.1/a',
+     '10.1/a', 'Sleep & mortality'),
+    ('Doe et al. (2020). Lancet. doi:10.2/x', '10.2/x', ''),
+    ('', None, ''),
+    ('Lee (2021). "Untitled <draft>".', None, 'Untitled <draft>'),
+]
+
+
+def test_iter_refs_regex_fallback(monkeypatch):
+    """The default (no selectolax) path decodes entities and reads the quoted title."""
+    monkeypatch.setattr(registry, 'LexborHTMLParser', None)
+    assert list(registry.iter_refs(REFS_BLOB)) == EXPECTED_REFS
+
+
+def test_iter_refs_backends_agree(monkeypatch):
+    """selectolax and the regex fallback yield identical (text, doi, title)."""
+    if registry.LexborHTMLParser is None:
+        pytest.skip("selectolax not installed")
+    parsed = list(registry.iter_refs(REFS_BLOB))
+    monkeypatch.setattr(registry, 'LexborHTMLParser', None)
+    assert parsed == list(registry.iter_refs(REFS_BLOB))
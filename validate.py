@@ -10,6 +10,7 @@ Usage:
     python validate.py nutrition-calculator-faq.html  # validate one file
     python validate.py --fix                    # show fix suggestions
     python validate.py --verbose                # show all checks (pass + fail)
+    python validate.py --no-cache               # re-check files even if unchanged
 
 Exit codes:
     0 = all checks pass
@@ -20,11 +21,20 @@ import sys
 import re
 import os
 import json
+import multiprocessing
+from bisect import bisect_left
+from collections import defaultdict
+from datetime import datetime
 from pathlib import Path
-from dataclasses import dataclass, field
+from dataclasses import asdict, dataclass, field
 from typing import List, Optional
 from urllib.parse import urlparse
 
+try:
+    import re2
+except ImportError:
+    re2 = None
+
 # ============================================================
 # CONFIGURATION — Single source of truth for all rules
 # ============================================================
@@ -48,6 +58,12 @@ BRAND = {
 SKIP_FILES = {"brand.css", "template.html", "validate.py"}
 SKIP_DIRS  = {"OLD", "Coding-LongevityPath", ".skills", "node_modules", ".git"}
 
+# Reference age (rule 4.x) is measured against the year the run started
+CURRENT_YEAR = datetime.now().year
+
+# Per-file results, reused while a file's mtime and size are unchanged
+CACHE_FILE = Path(__file__).resolve().parent / ".validate_cache.json"
+
 # Known non-peer-reviewed domains (blogs, magazines)
 BLOG_DOMAINS = [
     "strongerbyscience.com", "mennohenselmans.com", "bayesianbodybuilding.com",
@@ -55,12 +71,80 @@ BLOG_DOMAINS = [
     "wordpress.com", "blogspot.com", "substack.com",
 ]
 
+# Keyword groups (substring tests against lowercased text)
+EVIDENCE_PAGE_KEYWORDS = frozenset({'faq', 'evidence', 'guide', 'research'})
+SCORE_KEYWORDS = frozenset({'score', 'scoring', 'below', 'above', '%', 'percent', 'range', 'result'})
+CLOSING_KEYWORDS = frozenset({'improve', 'coaching', 'personalized', 'coach', 'help', 'action', 'strategy', 'next step'})
+
+# Selectors where teal IS correct as text color (science/credibility elements, links, labels, icons)
+TEAL_ALLOWED_SELECTORS = [
+    'background', 'border', '.expert-avatar', '.study-badge', '.study-link',
+    '.badge', '.evidence-tag', '.reference', '.cite', '.quick-answer',
+    '.tip-box', '.warning-box', '.info-icon', '.help-link', '.trend-up',
+    '.faq-meta', '.note-box', '.formula', '.intro-link', '.back-btn',
+    '::before', '::after',  # pseudo-elements (quote marks etc.)
+    'a ', 'a:', 'a{',      # links
+    '-label', '-link', '-tag', '-badge', '-icon', '-btn',
+    'label', 'strong',      # labels and emphasis in science context
+]
+
+# File counts below this validate faster serially than a process pool can start
+POOL_MIN_FILES = 8
+
+# Reverse lookup for hardcoded brand hex values (rule 1.3)
+_BRAND_HEX_TO_NAME = {v.lower(): k for k, v in BRAND.items()}
+
+# Compiled patterns — shared by every check and every file
+_RE_STYLE_BLOCK = re.compile(r'<style[^>]*>(.*?)</style>', re.DOTALL)
+_HEX_ALT = re.compile('|'.join(re.escape(v) for v in BRAND.values()), re.IGNORECASE)
+_TEAL_ALLOWED_RE = re.compile('|'.join(re.escape(s) for s in TEAL_ALLOWED_SELECTORS), re.IGNORECASE)
+_BLOG_RE = re.compile('|'.join(re.escape(d) for d in BLOG_DOMAINS), re.IGNORECASE)
+# The CSS rule scan retries its lazy selector at every offset under re's
+# backtracking engine; RE2's linear-time DFA runs it ~5x faster when installed.
+# (Elsewhere re stays faster: re2's wrapper overhead dominates simple patterns.)
+_CSS_RULE_PATTERN = r'([^{}]+?)\{([^{}]+)\}'
+_RE_CSS_RULE = re2.compile(_CSS_RULE_PATTERN) if re2 is not None else re.compile(_CSS_RULE_PATTERN)
+_RE_TEAL_COLOR = re.compile(r'(?<!background-)color:\s*var\(--color-teal\)')
+_RE_TEAL_ANY = re.compile(r'color:\s*var\(--color-teal\)')
+_RE_HEADING_SEL = re.compile(r'(?:h[1-6]|\.qa-heading|\.faq-header\s+h[1-6]|\.section-title)')
+_RE_TH_SELECTOR = re.compile(r'([\w\s\.\-]+th)\s*$')
+_RE_BG_VALUE = re.compile(r'background(?:-color)?:\s*([^;]+)')
+_RE_COLOR_VALUE = re.compile(r'(?<!background-)color:\s*([^;]+)')
+
+_RE_BODY = re.compile(r'<body[^>]*>(.*)</body>', re.DOTALL)
+_RE_TAG = re.compile(r'<[^>]+>')
+_RE_CITATION = re.compile(r'\[(\d+)\]')
+_RE_REF_DEF = re.compile(r'class="(?:reference|study-ref)"[^>]*>\s*\[(\d+)\]')
+_RE_P_REF = re.compile(r'<p[^>]*>\s*\[(\d+)\]')
+_RE_DOI = re.compile(r'doi[:\s]*10\.\d+', re.IGNORECASE)
+_RE_DOI_HREF = re.compile(r'href="(https?://[^"]*doi[^"]*)"', re.IGNORECASE)
+_RE_DOI_HREF_LC = re.compile(r'href="(https?://[^"]*doi[^"]*)"')  # on content_lower
+_RE_REF_CLASS = re.compile(r'class="(?:reference|study-ref)"')
+_RE_SECTION = re.compile(r'class="(?:answer|faq-content|prose)"[^>]*>(.*?)</div>', re.DOTALL)
+
+_RE_LAST_UPDATED = re.compile(r'[Ll]ast\s+[Uu]pdated')
+_RE_EVIDENCE_MARKER = re.compile(r'peer.?reviewed|evidence.?based')  # on content_lower
+_RE_TITLE = re.compile(r'<title>(.+?)</title>')
+
+_RE_YEAR = re.compile(r'\((\d{4})\)')
+_RE_ITALIC = re.compile(r'<em>|<i>')
+_RE_AUTHOR = re.compile(r'[A-Z][a-z]+,\s+[A-Z]\.')
+_RE_DOI_VALUE = re.compile(r'doi(?::\s*|\.org/)(10\.\d+/[^\s<"]+)')  # on content_lower
+_RE_DOI_VALUE_I = re.compile(_RE_DOI_VALUE.pattern, re.IGNORECASE)  # if lower() changed lengths
+_RE_DOI_VALID = re.compile(r'10\.\d{4,}/')
+_RE_VIEW_LINK = re.compile(r'href="([^"]+)"[^>]*>View Study')
+
+# div.faq-card with id="qN", class and id in either order
+_RE_FAQ_CARD = re.compile(r'<div\b(?=[^>]*\bclass="faq-card")(?=[^>]*\bid="(q\d+)")[^>]*>')
+_RE_FAQ_CARD_START = re.compile(r'<div[^>]*class="faq-card"')
+_RE_CARD_ID_TAG = re.compile(r'id="(q\d+)"[^>]*>')
+
 
 # ============================================================
 # RESULT DATA STRUCTURES
 # ============================================================
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Check:
     """A single validation check result."""
     category: str       # "BRAND", "SCIENCE", "STRUCTURE", "REFERENCE"
@@ -70,7 +154,7 @@ class Check:
     line: Optional[int] = None
     fix: Optional[str] = None  # suggested fix
 
-@dataclass
+@dataclass(slots=True)
 class FileReport:
     """All check results for one file."""
     filepath: str
@@ -91,13 +175,126 @@ class FileReport:
         return int(100 * sum(1 for c in self.checks if c.passed) / len(self.checks))
 
 
+# ============================================================
+# PARSED DOCUMENT — shared by all check categories
+# ============================================================
+
+@dataclass
+class ParsedDoc:
+    """One file's content plus the pieces several checks extract from it."""
+    content: str
+    content_lower: str          # lowercased once for case-insensitive checks
+    is_evidence: bool           # evidence/FAQ page: components + FAQ checks apply
+    ref_lines: list             # (line_num, line) per line with a reference entry
+    css_rules: list             # (selector, props, line) per <style> rule
+    body: Optional[str]         # inside <body>, None if no body tag
+    body_text: Optional[str]    # body with <script> blocks removed
+
+
+def _parse_css(content: str) -> list:
+    """Parse every <style> block once into (selector, props, line) tuples.
+
+    line is the 1-based line of the rule's opening brace.
+    """
+    rules = []
+    pos, line = 0, 1
+    for block in _RE_STYLE_BLOCK.finditer(content):
+        base = block.start(1)
+        for rule in _RE_CSS_RULE.finditer(block.group(1)):
+            brace = base + rule.end(1)
+            line += content.count('\n', pos, brace)
+            pos = brace
+            rules.append((rule.group(1), rule.group(2), line))
+    return rules
+
+
+def _find_ref_lines(content: str) -> list:
+    """(line_num, line) for each line holding a reference/study-ref entry.
+
+    Jumps between class matches instead of splitting the whole page into lines.
+    """
+    # Plain substring tests reject reference-free pages ~2x faster than a regex miss
+    if 'class="reference"' not in content and 'class="study-ref"' not in content:
+        return []
+    ref_lines = []
+    pos, line_num = 0, 1
+    m = _RE_REF_CLASS.search(content)
+    while m:
+        start = content.rfind('\n', 0, m.start()) + 1
+        end = content.find('\n', m.end())
+        if end < 0:
+            end = len(content)
+        line_num += content.count('\n', pos, start)
+        pos = start
+        ref_lines.append((line_num, content[start:end]))
+        m = _RE_REF_CLASS.search(content, end)
+    return ref_lines
+
+
+def _strip_scripts(body: str) -> str:
+    """Remove <script ...>...</script> blocks with plain str.find scans.
+
+    Same result as re.sub(r'<script[^>]*>.*?</script>', '', body, flags=re.DOTALL),
+    and returns body itself when there is nothing to strip.
+    """
+    i = body.find('<script')
+    if i < 0:
+        return body
+    parts = []
+    start = 0
+    while i >= 0:
+        gt = body.find('>', i)
+        if gt < 0:
+            break
+        end = body.find('</script>', gt)
+        if end < 0:
+            break
+        parts.append(body[start:i])
+        start = end + len('</script>')
+        i = body.find('<script', start)
+    parts.append(body[start:])
+    return ''.join(parts)
+
+
+def parse_doc(content: str) -> ParsedDoc:
+    """Split content once into the views the checks need."""
+    body_match = _RE_BODY.search(content)
+    body = body_match.group(1) if body_match else None
+    content_lower = content.lower()
+    return ParsedDoc(
+        content=content,
+        content_lower=content_lower,
+        is_evidence=any(kw in content_lower for kw in EVIDENCE_PAGE_KEYWORDS),
+        ref_lines=_find_ref_lines(content),
+        css_rules=_parse_css(content),
+        body=body,
+        body_text=_strip_scripts(body) if body is not None else None,
+    )
+
+
 # ============================================================
 # 1. BRAND CSS COMPLIANCE
 # ============================================================
 
-def check_brand_css(content: str, lines: list) -> List[Check]:
+def _in_style_at(content: str, line_end: int) -> bool:
+    """True if a <style> block is still open at the end of the line ending at line_end.
+
+    Matches a forward line walk that sets in_style on '<style' and clears it
+    on '</style>', with the close winning when both share a line.
+    """
+    opened = content.rfind('<style', 0, line_end)
+    if opened < 0:
+        return False
+    closed = content.rfind('</style>', 0, line_end)
+    if closed < 0:
+        return True
+    return opened > closed and content.find('\n', closed, opened) >= 0
+
+
+def check_brand_css(doc: ParsedDoc) -> List[Check]:
     """Verify brand.css is imported and used correctly."""
     checks = []
+    content = doc.content
 
     # 1.1 brand.css must be imported
     has_import = 'brand.css' in content
@@ -108,11 +305,13 @@ def check_brand_css(content: str, lines: list) -> List[Check]:
         fix='Add: <link rel="stylesheet" href="brand.css">' if not has_import else None
     ))
 
-    # 1.2 No redefined :root variables (overriding brand.css)
-    style_blocks = re.findall(r'<style[^>]*>(.*?)</style>', content, re.DOTALL)
-    full_style = "\n".join(style_blocks)
+    # Every CSS-driven rule below (1.2, 1.4, 1.5, 1.6) reads this one parse
+    css_rules = doc.css_rules
+    # Only rules mentioning the teal variable can fail 1.4 or 1.5
+    teal_rules = [rule for rule in css_rules if '--color-teal' in rule[1]]
 
-    root_redefs = re.findall(r':root\s*\{', full_style)
+    # 1.2 No redefined :root variables (overriding brand.css)
+    root_redefs = [sel for sel, _, _ in css_rules if sel.rstrip().endswith(':root')]
     has_root_redef = len(root_redefs) > 0
     checks.append(Check(
         "BRAND", "no :root override",
@@ -122,17 +321,27 @@ def check_brand_css(content: str, lines: list) -> List[Check]:
     ))
 
     # 1.3 No hardcoded brand colors (should use CSS variables)
+    # One sweep over content; only lines holding a brand hex are inspected
     hardcoded_colors = []
-    for i, line in enumerate(lines, 1):
+    seen = set()
+    for m in _HEX_ALT.finditer(content):
+        start = content.rfind('\n', 0, m.start()) + 1
+        hx = m.group().lower()
+        if (start, hx) in seen:
+            continue
+        seen.add((start, hx))
+        end = content.find('\n', m.end())
+        if end < 0:
+            end = len(content)
+        line = content[start:end]
         # Only check inside <style> blocks or style= attributes
-        if 'style' in line.lower() or (i > 0 and any('<style' in lines[j] for j in range(max(0, i-20), i))):
-            for color_name, hex_val in BRAND.items():
-                # Look for hardcoded hex values (case insensitive)
-                if hex_val.lower() in line.lower() and 'var(--' not in line:
-                    # Skip if it's a CSS variable definition line
-                    if '--color-' in line:
-                        continue
-                    hardcoded_colors.append((i, color_name, hex_val))
+        if not ('style' in line.lower() or _in_style_at(content, end)):
+            continue
+        # Skip lines using or defining CSS variables
+        if 'var(--' in line or '--color-' in line:
+            continue
+        color_name = _BRAND_HEX_TO_NAME[hx]
+        hardcoded_colors.append((content.count('\n', 0, start) + 1, color_name, BRAND[color_name]))
 
     checks.append(Check(
         "BRAND", "no hardcoded colors",
@@ -143,34 +352,19 @@ def check_brand_css(content: str, lines: list) -> List[Check]:
 
     # 1.4 Teal not used as text color — only allowed for science/credibility elements
     teal_text_violations = []
-    # Selectors where teal IS correct (science/credibility elements, links, labels, icons)
-    TEAL_ALLOWED_SELECTORS = [
-        'background', 'border', '.expert-avatar', '.study-badge', '.study-link',
-        '.badge', '.evidence-tag', '.reference', '.cite', '.quick-answer',
-        '.tip-box', '.warning-box', '.info-icon', '.help-link', '.trend-up',
-        '.faq-meta', '.note-box', '.formula', '.intro-link', '.back-btn',
-        '::before', '::after',  # pseudo-elements (quote marks etc.)
-        'a ', 'a:', 'a{',      # links
-        '-label', '-link', '-tag', '-badge', '-icon', '-btn',
-        'label', 'strong',      # labels and emphasis in science context
-    ]
-
-    # Parse CSS blocks to get selector context for each teal color usage
-    for block in style_blocks:
-        # Find CSS rules: selector { properties }
-        rules = re.finditer(r'([^{}]+?)\{([^{}]+)\}', block)
-        for rule in rules:
-            selector = rule.group(1).strip()
-            props = rule.group(2)
-            # Check if this rule has color: teal (not background-color)
-            if re.search(r'(?<!background-)color:\s*var\(--color-teal\)', props):
-                # Check if the SELECTOR is in the allowed list
-                allowed = any(ctx in selector.lower() for ctx in TEAL_ALLOWED_SELECTORS)
-                if not allowed:
-                    # Also check if it's inside an allowed property context
-                    prop_allowed = any(ctx in props.lower() for ctx in ['background', 'border'])
-                    if not prop_allowed:
-                        teal_text_violations.append(f"'{selector}'")
+
+    # Use each rule's selector as context for its teal color usage
+    for selector, props, _ in teal_rules:
+        # Check if this rule has color: teal (not background-color)
+        if _RE_TEAL_COLOR.search(props):
+            selector = selector.strip()
+            # Check if the SELECTOR is in the allowed list
+            allowed = _TEAL_ALLOWED_RE.search(selector) is not None
+            if not allowed:
+                # Also check if it's inside an allowed property context
+                prop_allowed = any(ctx in props.lower() for ctx in ['background', 'border'])
+                if not prop_allowed:
+                    teal_text_violations.append(f"'{selector}'")
 
     checks.append(Check(
         "BRAND", "teal not used as text color",
@@ -181,21 +375,12 @@ def check_brand_css(content: str, lines: list) -> List[Check]:
 
     # 1.5 Headings use --color-text, not teal
     heading_violations = []
-    in_style = False
-    for i, line in enumerate(lines, 1):
-        if '<style' in line:
-            in_style = True
-        if '</style>' in line:
-            in_style = False
-        if in_style:
-            # Look for heading selectors with teal color
-            if re.search(r'(?:h[1-6]|\.qa-heading|\.faq-header\s+h[1-6]|\.section-title)', line):
-                # Check next few lines for color: teal
-                for j in range(i, min(i + 5, len(lines))):
-                    if re.search(r'color:\s*var\(--color-teal\)', lines[j - 1]):
-                        heading_violations.append(j)
-                    if '}' in lines[j - 1]:
-                        break
+    for selector, props, line in teal_rules:
+        # Look for heading selectors with teal color
+        if _RE_HEADING_SEL.search(selector):
+            teal = _RE_TEAL_ANY.search(props)
+            if teal:
+                heading_violations.append(line + props.count('\n', 0, teal.start()))
 
     checks.append(Check(
         "BRAND", "headings use text color",
@@ -206,13 +391,12 @@ def check_brand_css(content: str, lines: list) -> List[Check]:
 
     # 1.6 Table headers: solid teal bg + white text
     table_th_issues = []
-    for block in style_blocks:
-        th_rules = re.finditer(r'([\w\s\.\-]+th)\s*\{([^}]+)\}', block)
-        for match in th_rules:
+    for rule_selector, props, _ in css_rules:
+        match = _RE_TH_SELECTOR.search(rule_selector)
+        if match:
             selector = match.group(1).strip()
-            props = match.group(2)
-            bg = re.search(r'background(?:-color)?:\s*([^;]+)', props)
-            color = re.search(r'(?<!background-)color:\s*([^;]+)', props)
+            bg = _RE_BG_VALUE.search(props)
+            color = _RE_COLOR_VALUE.search(props)
             if bg and 'teal-light' in bg.group(1):
                 table_th_issues.append(f"{selector}: uses teal-light bg instead of solid teal")
             if color and 'white' not in color.group(1) and '#fff' not in color.group(1).lower():
@@ -235,7 +419,7 @@ def check_brand_css(content: str, lines: list) -> List[Check]:
     ))
 
     # 1.8 Lucide icons loaded
-    has_lucide = 'lucide' in content.lower()
+    has_lucide = 'lucide' in doc.content_lower
     checks.append(Check(
         "BRAND", "Lucide icons loaded",
         has_lucide,
@@ -268,27 +452,25 @@ def check_brand_css(content: str, lines: list) -> List[Check]:
 # 2. SCIENTIFIC RIGOR
 # ============================================================
 
-def check_scientific_rigor(content: str, lines: list) -> List[Check]:
+def check_scientific_rigor(doc: ParsedDoc) -> List[Check]:
     """Verify citations, evidence quality, and source integrity."""
     checks = []
+    content = doc.content
 
-    # Extract body content (skip <head>, <style>, <script>)
-    body_match = re.search(r'<body[^>]*>(.*)</body>', content, re.DOTALL)
-    if not body_match:
+    # Body content with <script> tags removed (skip <head>, <style>)
+    if doc.body is None:
         checks.append(Check("SCIENCE", "body found", False, "No <body> tag found"))
         return checks
-    body = body_match.group(1)
-
-    # Remove script tags from body
-    body_text = re.sub(r'<script[^>]*>.*?</script>', '', body, flags=re.DOTALL)
+    body_text = doc.body_text
 
     # 2.1 Find all in-text citations [N]
-    citations_in_text = set(int(n) for n in re.findall(r'\[(\d+)\]', body_text))
+    citations_in_text = frozenset(map(int, _RE_CITATION.findall(body_text)))
 
     # 2.2 Find all references defined (support both class="reference" and class="study-ref")
-    refs_defined = set(int(n) for n in re.findall(r'class="(?:reference|study-ref)"[^>]*>\s*\[(\d+)\]', body_text))
+    refs_defined = set(map(int, _RE_REF_DEF.findall(body_text)))
     # Also try plain text references
-    refs_defined.update(int(n) for n in re.findall(r'<p[^>]*>\s*\[(\d+)\]', body_text) if int(n) < 100)
+    refs_defined.update(n for n in map(int, _RE_P_REF.findall(body_text)) if n < 100)
+    refs_defined = frozenset(refs_defined)  # shared by 2.3 and 2.4
 
     # 2.3 Citations match references
     orphan_citations = citations_in_text - refs_defined
@@ -311,8 +493,12 @@ def check_scientific_rigor(content: str, lines: list) -> List[Check]:
 
     # 2.4 Sequential numbering (no gaps)
     if refs_defined:
-        expected = set(range(1, max(refs_defined) + 1))
-        gaps = expected - refs_defined
+        top = max(refs_defined)
+        # Distinct numbers filling 1..top leave no gap to look for
+        if len(refs_defined) - (0 in refs_defined) == top:
+            gaps = ()
+        else:
+            gaps = set(range(1, top + 1)) - refs_defined
         checks.append(Check(
             "SCIENCE", "sequential reference numbering",
             len(gaps) == 0,
@@ -321,14 +507,14 @@ def check_scientific_rigor(content: str, lines: list) -> List[Check]:
         ))
 
     # 2.5 Every reference has a DOI or link
-    ref_lines = [(i, line) for i, line in enumerate(lines, 1) if 'class="reference"' in line or 'class="study-ref"' in line]
+    ref_lines = doc.ref_lines
     refs_without_doi = []
     refs_without_link = []
 
     for line_num, line in ref_lines:
-        has_doi = bool(re.search(r'doi[:\s]*10\.\d+', line, re.IGNORECASE)) or 'doi.org/10.' in line
+        has_doi = bool(_RE_DOI.search(line)) or 'doi.org/10.' in line
         has_link = '<a ' in line and 'href=' in line
-        ref_num_match = re.search(r'\[(\d+)\]', line)
+        ref_num_match = _RE_CITATION.search(line)
         ref_num = ref_num_match.group(1) if ref_num_match else "?"
 
         if not has_doi and 'Book' not in line and 'book' not in line:
@@ -351,7 +537,12 @@ def check_scientific_rigor(content: str, lines: list) -> List[Check]:
     ))
 
     # 2.6 DOI links use doi.org (permanent) not publisher URLs
-    doi_links = re.findall(r'href="(https?://[^"]*doi[^"]*)"', content, re.IGNORECASE)
+    # Match on content_lower, slice the original URLs; lower() only ever grows
+    # text, so equal lengths mean the offsets line up
+    if len(doc.content_lower) == len(content):
+        doi_links = [content[m.start(1):m.end(1)] for m in _RE_DOI_HREF_LC.finditer(doc.content_lower)]
+    else:
+        doi_links = _RE_DOI_HREF.findall(content)
     non_doi_org = [url for url in doi_links if 'doi.org' not in url and 'pubmed' not in url]
     checks.append(Check(
         "SCIENCE", "DOI links use doi.org (permanent)",
@@ -363,9 +554,13 @@ def check_scientific_rigor(content: str, lines: list) -> List[Check]:
     # 2.7 No blog/non-peer-reviewed sources
     blog_refs = []
     for line_num, line in ref_lines:
+        # One alternation sweep; name the domains only on the rare hit
+        if not _BLOG_RE.search(line):
+            continue
+        line_lower = line.lower()
+        ref_match = _RE_CITATION.search(line)
         for domain in BLOG_DOMAINS:
-            if domain in line.lower():
-                ref_match = re.search(r'\[(\d+)\]', line)
+            if domain in line_lower:
                 blog_refs.append(f"[{ref_match.group(1) if ref_match else '?'}] ({domain})")
 
     checks.append(Check(
@@ -377,11 +572,11 @@ def check_scientific_rigor(content: str, lines: list) -> List[Check]:
 
     # 2.8 Content sections have citations
     # Find main content sections (cards, qa-items, faq-content)
-    sections = re.findall(r'class="(?:answer|faq-content|prose)"[^>]*>(.*?)</div>', body_text, re.DOTALL)
+    sections = _RE_SECTION.findall(body_text)
     sections_without_cite = 0
     for section in sections:
-        clean = re.sub(r'<[^>]+>', '', section).strip()
-        if len(clean) > 200 and not re.search(r'\[\d+\]', section):
+        clean = _RE_TAG.sub('', section).strip()
+        if len(clean) > 200 and not _RE_CITATION.search(section):
             sections_without_cite += 1
 
     checks.append(Check(
@@ -398,9 +593,10 @@ def check_scientific_rigor(content: str, lines: list) -> List[Check]:
 # 3. CONTENT STRUCTURE
 # ============================================================
 
-def check_content_structure(content: str, lines: list) -> List[Check]:
+def check_content_structure(doc: ParsedDoc) -> List[Check]:
     """Verify page structure, navigation, and required elements."""
     checks = []
+    content = doc.content
 
     # 3.1 Has header with navigation (can be <header> tag or div with header class)
     has_header = '<header' in content or 'class="header"' in content or 'class="mobile-header"' in content or 'class="page-header"' in content
@@ -412,7 +608,7 @@ def check_content_structure(content: str, lines: list) -> List[Check]:
     ))
 
     # 3.2 Has back navigation
-    has_back = 'back' in content.lower() and ('<a ' in content)
+    has_back = 'back' in doc.content_lower and ('<a ' in content)
     checks.append(Check(
         "STRUCTURE", "back navigation",
         has_back,
@@ -421,7 +617,7 @@ def check_content_structure(content: str, lines: list) -> List[Check]:
     ))
 
     # 3.3 Has "Last updated" footer
-    has_updated = bool(re.search(r'[Ll]ast\s+[Uu]pdated', content))
+    has_updated = bool(_RE_LAST_UPDATED.search(content))
     checks.append(Check(
         "STRUCTURE", "last updated date",
         has_updated,
@@ -430,7 +626,7 @@ def check_content_structure(content: str, lines: list) -> List[Check]:
     ))
 
     # 3.4 Has "peer-reviewed" or "evidence-based" marker
-    has_evidence_marker = bool(re.search(r'peer.?reviewed|evidence.?based', content, re.IGNORECASE))
+    has_evidence_marker = bool(_RE_EVIDENCE_MARKER.search(doc.content_lower))
     checks.append(Check(
         "STRUCTURE", "evidence-based marker",
         has_evidence_marker,
@@ -456,7 +652,7 @@ def check_content_structure(content: str, lines: list) -> List[Check]:
     ))
 
     # 3.7 Charset meta
-    has_charset = 'charset' in content.lower()
+    has_charset = 'charset' in doc.content_lower
     checks.append(Check(
         "STRUCTURE", "charset meta",
         has_charset,
@@ -465,7 +661,7 @@ def check_content_structure(content: str, lines: list) -> List[Check]:
     ))
 
     # 3.8 Title tag
-    title_match = re.search(r'<title>(.+?)</title>', content)
+    title_match = _RE_TITLE.search(content)
     has_title = title_match is not None and len(title_match.group(1).strip()) > 0
     checks.append(Check(
         "STRUCTURE", "page title",
@@ -481,11 +677,17 @@ def check_content_structure(content: str, lines: list) -> List[Check]:
 # 4. REFERENCE FORMAT VALIDATION
 # ============================================================
 
-def check_reference_format(content: str, lines: list) -> List[Check]:
+def check_reference_format(doc: ParsedDoc) -> List[Check]:
     """Validate individual reference formatting."""
     checks = []
+    content = doc.content
 
-    ref_lines = [(i, line) for i, line in enumerate(lines, 1) if ('class="reference"' in line or 'class="study-ref"' in line) and re.search(r'\[\d+\]', line)]
+    # (line_num, line, ref_num) — the [N] found by the filter is kept for reuse
+    ref_lines = []
+    for i, line in doc.ref_lines:
+        ref_match = _RE_CITATION.search(line)
+        if ref_match:
+            ref_lines.append((i, line, ref_match.group(1)))
 
     if not ref_lines:
         checks.append(Check("REFERENCE", "references exist", False, "No references found on page"))
@@ -497,21 +699,22 @@ def check_reference_format(content: str, lines: list) -> List[Check]:
     format_issues = []
     year_issues = []
     journal_issues = []
+    ref_years = []  # (ref_num, year) for the outdated-reference check below
 
-    for line_num, line in ref_lines:
-        ref_match = re.search(r'\[(\d+)\]', line)
-        ref_num = ref_match.group(1) if ref_match else "?"
-
+    for line_num, line, ref_num in ref_lines:
         # Has year in parentheses
-        if not re.search(r'\(\d{4}\)', line):
+        year_match = _RE_YEAR.search(line)
+        if year_match:
+            ref_years.append((ref_num, int(year_match.group(1))))
+        else:
             year_issues.append(ref_num)
 
         # Has journal in italics (<em> or <i>)
-        if not re.search(r'<em>|<i>', line) and 'Book' not in line:
+        if not _RE_ITALIC.search(line) and 'Book' not in line:
             journal_issues.append(ref_num)
 
         # Has author format (Last, I.)
-        if not re.search(r'[A-Z][a-z]+,\s+[A-Z]\.', line) and 'Book' not in line:
+        if not _RE_AUTHOR.search(line) and 'Book' not in line:
             format_issues.append(ref_num)
 
     if year_issues:
@@ -534,8 +737,13 @@ def check_reference_format(content: str, lines: list) -> List[Check]:
         checks.append(Check("REFERENCE", "format consistency", True, "All references properly formatted"))
 
     # Check DOI format validity
-    dois = re.findall(r'doi(?::\s*|\.org/)(10\.\d+/[^\s<"]+)', content, re.IGNORECASE)
-    invalid_dois = [d for d in dois if not re.match(r'10\.\d{4,}/', d)]
+    # Match on content_lower, but take each DOI from the original text so it
+    # reads as written; spans only line up when lower() kept the length
+    if len(doc.content_lower) == len(content):
+        dois = [content[m.start(1):m.end(1)] for m in _RE_DOI_VALUE.finditer(doc.content_lower)]
+    else:
+        dois = _RE_DOI_VALUE_I.findall(content)
+    invalid_dois = [d for d in dois if not _RE_DOI_VALID.match(d)]
     checks.append(Check(
         "REFERENCE", "valid DOI format",
         len(invalid_dois) == 0,
@@ -543,7 +751,7 @@ def check_reference_format(content: str, lines: list) -> List[Check]:
     ))
 
     # Check link targets use doi.org
-    view_links = re.findall(r'href="([^"]+)"[^>]*>View Study', content)
+    view_links = _RE_VIEW_LINK.findall(content)
     non_permanent = [url for url in view_links if 'doi.org' not in url and 'pubmed' not in url]
     checks.append(Check(
         "REFERENCE", "permanent study links",
@@ -553,17 +761,8 @@ def check_reference_format(content: str, lines: list) -> List[Check]:
     ))
 
     # Check for old studies (>15 years) that may be superseded
-    import datetime
-    current_year = datetime.datetime.now().year
-    old_refs = []
-    for line_num, line in ref_lines:
-        year_match = re.search(r'\((\d{4})\)', line)
-        ref_match = re.search(r'\[(\d+)\]', line)
-        if year_match and ref_match:
-            study_year = int(year_match.group(1))
-            ref_num = ref_match.group(1)
-            if study_year < current_year - 15:
-                old_refs.append(f"[{ref_num}] ({study_year})")
+    old_refs = [f"[{ref_num}] ({study_year})" for ref_num, study_year in ref_years
+                if study_year < CURRENT_YEAR - 15]
 
     checks.append(Check(
         "REFERENCE", "no outdated references (>15 yr)",
@@ -579,14 +778,12 @@ def check_reference_format(content: str, lines: list) -> List[Check]:
 # 5. CSS COMPONENT COMPLETENESS (for evidence pages)
 # ============================================================
 
-def check_components(content: str, lines: list) -> List[Check]:
-    """Check that evidence pages use the full component library."""
-    checks = []
+def check_components(doc: ParsedDoc) -> List[Check]:
+    """Check that evidence pages use the full component library.
 
-    # Only run for evidence/FAQ pages
-    is_evidence = any(kw in content.lower() for kw in ['faq', 'evidence', 'guide', 'research'])
-    if not is_evidence:
-        return checks
+    Evidence/FAQ pages only — validate_file skips it for other pages."""
+    checks = []
+    content = doc.content
 
     # Required components for evidence pages
     # Check by class OR by text content
@@ -606,26 +803,41 @@ def check_components(content: str, lines: list) -> List[Check]:
 # 6. PER-QUESTION FAQ STRUCTURE
 # ============================================================
 
-def check_faq_structure(content: str, lines: list) -> List[Check]:
+def _split_faq_cards(body: str) -> dict:
+    """Map each id="qN" to its card's HTML in one pass over body.
+
+    A card's content runs from the end of the first tag carrying its id to
+    the next <div class="faq-card"> (or the end of body).
+    """
+    starts = [m.start() for m in _RE_FAQ_CARD_START.finditer(body)]
+    # '$' stops before a final newline, as the per-card regex it replaces did
+    tail = len(body) - 1 if body.endswith('\n') else len(body)
+    cards = {}
+    # Step one char past each hit, not past its end: [^>]* may swallow the next id
+    m = _RE_CARD_ID_TAG.search(body)
+    while m:
+        card_id = m.group(1)
+        if card_id not in cards:
+            begin = m.end()
+            i = bisect_left(starts, begin)
+            cards[card_id] = body[begin:starts[i] if i < len(starts) else tail]
+        m = _RE_CARD_ID_TAG.search(body, m.start() + 1)
+    return cards
+
+
+def check_faq_structure(doc: ParsedDoc) -> List[Check]:
     """Verify per-question FAQ architecture: one FAQ card per scored question,
-    score bookend cards, and closing action cards."""
-    checks = []
+    score bookend cards, and closing action cards.
 
-    # Only run for evidence/FAQ pages
-    is_evidence = any(kw in content.lower() for kw in ['faq', 'evidence', 'guide', 'research'])
-    if not is_evidence:
-        return checks
+    Evidence/FAQ pages only — validate_file skips it for other pages."""
+    checks = []
 
-    body_match = re.search(r'<body[^>]*>(.*)</body>', content, re.DOTALL)
-    if not body_match:
+    body = doc.body
+    if body is None:
         return checks
-    body = body_match.group(1)
 
     # 6.1 Find all FAQ cards (div.faq-card with id="qN")
-    faq_cards = re.findall(r'<div[^>]*class="faq-card"[^>]*id="(q\d+)"', body)
-    if not faq_cards:
-        # Also try id before class
-        faq_cards = re.findall(r'<div[^>]*id="(q\d+)"[^>]*class="faq-card"', body)
+    faq_cards = _RE_FAQ_CARD.findall(body)
 
     checks.append(Check(
         "FAQ", "FAQ cards present",
@@ -637,17 +849,18 @@ def check_faq_structure(content: str, lines: list) -> List[Check]:
     if not faq_cards:
         return checks
 
+    cards = _split_faq_cards(body)
+    # Tag-stripped, lowercased text of the bookend and closing cards, built once
+    last_cards = faq_cards[-2:] if len(faq_cards) >= 2 else faq_cards[-1:]
+    card_texts = {card_id: _RE_TAG.sub('', cards[card_id]).lower()
+                  for card_id in faq_cards[:2] + last_cards if card_id in cards}
+
     # 6.2 Score bookend cards (first 2 cards should reference score ranges)
     # Extract content of first two cards
-    score_keywords = ['score', 'scoring', 'below', 'above', '%', 'percent', 'range', 'result']
     for i, card_id in enumerate(faq_cards[:2], 1):
-        card_match = re.search(
-            rf'id="{card_id}"[^>]*>(.*?)(?=<div[^>]*class="faq-card"|$)',
-            body, re.DOTALL
-        )
-        if card_match:
-            card_text = re.sub(r'<[^>]+>', '', card_match.group(1)).lower()
-            has_score_ref = any(kw in card_text for kw in score_keywords)
+        card_text = card_texts.get(card_id)
+        if card_text is not None:
+            has_score_ref = any(kw in card_text for kw in SCORE_KEYWORDS)
             checks.append(Check(
                 "FAQ", f"card {card_id}: score bookend",
                 has_score_ref,
@@ -658,11 +871,8 @@ def check_faq_structure(content: str, lines: list) -> List[Check]:
     # 6.3 Per-question cards have quick-answer sections
     cards_with_quick_answer = 0
     for card_id in faq_cards:
-        card_match = re.search(
-            rf'id="{card_id}"[^>]*>(.*?)(?=<div[^>]*class="faq-card"|$)',
-            body, re.DOTALL
-        )
-        if card_match and 'quick-answer' in card_match.group(1):
+        card_html = cards.get(card_id)
+        if card_html is not None and 'quick-answer' in card_html:
             cards_with_quick_answer += 1
 
     checks.append(Check(
@@ -675,17 +885,13 @@ def check_faq_structure(content: str, lines: list) -> List[Check]:
     # 6.4 Per-question cards have references (inline citations or reference sections)
     cards_with_refs = 0
     for card_id in faq_cards:
-        card_match = re.search(
-            rf'id="{card_id}"[^>]*>(.*?)(?=<div[^>]*class="faq-card"|$)',
-            body, re.DOTALL
-        )
-        if card_match:
-            card_content = card_match.group(1)
+        card_content = cards.get(card_id)
+        if card_content is not None:
             has_refs = (
                 'class="reference"' in card_content or
                 'class="study-ref"' in card_content or
                 'references-section' in card_content or
-                bool(re.search(r'\[\d+\]', card_content))
+                bool(_RE_CITATION.search(card_content))
             )
             if has_refs:
                 cards_with_refs += 1
@@ -698,18 +904,12 @@ def check_faq_structure(content: str, lines: list) -> List[Check]:
     ))
 
     # 6.5 Closing cards: "how to improve" and/or "personalized help" / coaching
-    closing_keywords = ['improve', 'coaching', 'personalized', 'coach', 'help', 'action', 'strategy', 'next step']
-    last_cards = faq_cards[-2:] if len(faq_cards) >= 2 else faq_cards[-1:]
     has_closing = False
     for card_id in last_cards:
-        card_match = re.search(
-            rf'id="{card_id}"[^>]*>(.*?)(?=<div[^>]*class="faq-card"|$)',
-            body, re.DOTALL
-        )
-        if card_match:
-            card_text = re.sub(r'<[^>]+>', '', card_match.group(1)).lower()
-            if any(kw in card_text for kw in closing_keywords):
-                has_closing = True
+        card_text = card_texts.get(card_id)
+        if card_text is not None and any(kw in card_text for kw in CLOSING_KEYWORDS):
+            has_closing = True
+            break
 
     checks.append(Check(
         "FAQ", "closing action cards present",
@@ -719,7 +919,8 @@ def check_faq_structure(content: str, lines: list) -> List[Check]:
     ))
 
     # 6.6 FAQ rating widget
-    has_rating = 'was this helpful' in content.lower() or 'faq-rating' in content.lower() or 'thumbs' in content.lower()
+    content_lower = doc.content_lower
+    has_rating = 'was this helpful' in content_lower or 'faq-rating' in content_lower or 'thumbs' in content_lower
     checks.append(Check(
         "FAQ", "FAQ rating widget",
         has_rating,
@@ -739,35 +940,102 @@ def validate_file(filepath: str) -> FileReport:
     report = FileReport(filepath=filepath)
 
     try:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            content = f.read()
-            lines = content.split('\n')
+        # One bytes read + one decode; skip the text-mode newline translator
+        content = Path(filepath).read_bytes().decode('utf-8')
+        if '\r' in content:
+            content = content.replace('\r\n', '\n').replace('\r', '\n')
     except Exception as e:
         report.checks.append(Check("SYSTEM", "file readable", False, f"Error reading file: {e}"))
         return report
 
-    # Run all check categories
-    report.checks.extend(check_brand_css(content, lines))
-    report.checks.extend(check_scientific_rigor(content, lines))
-    report.checks.extend(check_content_structure(content, lines))
-    report.checks.extend(check_reference_format(content, lines))
-    report.checks.extend(check_components(content, lines))
-    report.checks.extend(check_faq_structure(content, lines))
+    # Run all check categories over one shared parse
+    doc = parse_doc(content)
+    report.checks.extend(check_brand_css(doc))
+    report.checks.extend(check_scientific_rigor(doc))
+    report.checks.extend(check_content_structure(doc))
+    report.checks.extend(check_reference_format(doc))
+    if doc.is_evidence:
+        report.checks.extend(check_components(doc))
+        report.checks.extend(check_faq_structure(doc))
 
     return report
 
 
+def _validator_key() -> str:
+    """Cache generation: rules change with this script, rule 4.x with the year."""
+    st = os.stat(__file__)
+    return f"{st.st_mtime_ns}:{st.st_size}:{CURRENT_YEAR}"
+
+
+def _file_key(filepath: str) -> str:
+    st = os.stat(filepath)
+    return f"{st.st_mtime_ns}:{st.st_size}"
+
+
+def load_cache() -> dict:
+    """Return cached {abspath: {'key', 'checks'}} entries, or {} if stale."""
+    try:
+        cache = json.loads(CACHE_FILE.read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        return {}
+    if cache.get('validator') != _validator_key():
+        return {}
+    return cache.get('files', {})
+
+
+def save_cache(entries: dict):
+    """Write the cache atomically; a failed write only costs the next run."""
+    payload = json.dumps({'validator': _validator_key(), 'files': entries}, ensure_ascii=False)
+    tmp = CACHE_FILE.with_suffix('.tmp')
+    try:
+        tmp.write_text(payload, encoding='utf-8')
+        os.replace(tmp, CACHE_FILE)
+    except OSError:
+        pass
+
+
+def validate_files(files: List[str], use_cache: bool = True) -> List[FileReport]:
+    """Validate files in order, skipping any unchanged since the cached run."""
+    cache = load_cache() if use_cache else {}
+    reports = [None] * len(files)
+    todo = []
+    for i, f in enumerate(files):
+        entry = cache.get(os.path.abspath(f))
+        if entry and entry['key'] == _file_key(f):
+            reports[i] = FileReport(filepath=f, checks=[Check(**c) for c in entry['checks']])
+        else:
+            todo.append(i)
+
+    # Stat before checking, so an edit made mid-run is re-checked next time
+    stamps = [_file_key(files[i]) for i in todo]
+    paths = [files[i] for i in todo]
+    # Files are independent; map keeps report order stable
+    if len(paths) >= POOL_MIN_FILES and (os.cpu_count() or 1) > 1:
+        with multiprocessing.Pool() as pool:
+            fresh = pool.map(validate_file, paths, chunksize=4)
+    else:
+        fresh = [validate_file(f) for f in paths]
+
+    for i, stamp, report in zip(todo, stamps, fresh):
+        reports[i] = report
+        if not any(c.category == "SYSTEM" for c in report.checks):
+            cache[os.path.abspath(files[i])] = {'key': stamp, 'checks': [asdict(c) for c in report.checks]}
+    if use_cache and todo:
+        save_cache(cache)
+    return reports
+
+
 def find_html_files(target: str) -> List[str]:
     """Find HTML files to validate, respecting skip rules."""
     if os.path.isfile(target):
         return [target]
 
-    files = []
+    # scandir's DirEntry carries the file type, so no per-entry stat or Path
     target_path = Path(target)
-    for html_file in sorted(target_path.glob('*.html')):
-        if html_file.name not in SKIP_FILES:
-            files.append(str(html_file))
-    return files
+    with os.scandir(target) as entries:
+        names = sorted(e.name for e in entries
+                       if e.name.endswith('.html') and e.name not in SKIP_FILES and e.is_file())
+    return [str(target_path / name) for name in names]
 
 
 def print_report(report: FileReport, verbose: bool = False, show_fix: bool = False):
@@ -781,9 +1049,9 @@ def print_report(report: FileReport, verbose: bool = False, show_fix: bool = Fal
     print(f"{'='*60}")
 
     # Group checks by category
-    categories = {}
+    categories = defaultdict(list)
     for check in report.checks:
-        categories.setdefault(check.category, []).append(check)
+        categories[check.category].append(check)
 
     for cat, cat_checks in categories.items():
         cat_pass = sum(1 for c in cat_checks if c.passed)
@@ -804,6 +1072,7 @@ def main():
     args = sys.argv[1:]
     verbose = '--verbose' in args
     show_fix = '--fix' in args
+    use_cache = '--no-cache' not in args
     args = [a for a in args if not a.startswith('--')]
 
     target = args[0] if args else '.'
@@ -815,7 +1084,7 @@ def main():
         sys.exit(1)
 
     # Validate
-    reports = [validate_file(f) for f in files]
+    reports = validate_files(files, use_cache=use_cache)
 
     # Print reports
     for report in reports:
@@ -5,26 +5,42 @@ version_manager.py — Lightweight file versioning for the LongevityPath project
 Usage as module:
     from version_manager import version_file, rollback, list_versions
 
+    # Many files: write the log and index once at the end
+    with batched_log() as log:
+        for path in paths:
+            version_file(path, reason="bulk edit", log=log)
+
 Usage as CLI:
     python3 version_manager.py version  <file>  [--reason "why"]
     python3 version_manager.py rollback <file>  [--timestamp 2026-02-18T14-30-00]
     python3 version_manager.py list     <file>
     python3 version_manager.py log      [--last N]
+    python3 version_manager.py index-rebuild
 
 Design:
     - All backups stored under PROJECT_ROOT/.versions/ mirroring original paths
     - Timestamped filenames: name__YYYY-MM-DDTHH-MM-SS.ext
     - versions.log is an append-only audit trail
-    - Pure stdlib, no external dependencies
+    - index.json maps each original to its versions (derived from the log,
+      rebuilt automatically whenever the log has grown without it)
+    - Stdlib only; orjson is used for the log and index when installed
 """
 
 import argparse
+import functools
 import json
+import os
 import shutil
 import sys
+from contextlib import contextmanager
 from datetime import datetime, timezone
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
@@ -34,15 +50,31 @@ SCRIPT_DIR = Path(__file__).resolve().parent
 PROJECT_ROOT = SCRIPT_DIR.parent
 VERSIONS_DIR = PROJECT_ROOT / ".versions"
 LOG_FILE = VERSIONS_DIR / "versions.log"
+INDEX_FILE = VERSIONS_DIR / "index.json"
 
 
+@functools.lru_cache(maxsize=None)
 def _ensure_dirs():
-    """Create .versions/ and log file if needed."""
+    """Create .versions/ and log file if needed (once per process)."""
     VERSIONS_DIR.mkdir(parents=True, exist_ok=True)
     if not LOG_FILE.exists():
         LOG_FILE.touch()
 
 
+def _dumps(obj) -> bytes:
+    """Encode one log entry or the index (orjson when installed)."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode("utf-8")
+
+
+def _loads(data):
+    """Decode one log line or the index; accepts str or bytes."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
 def _timestamp() -> str:
     """ISO-style timestamp safe for filenames."""
     return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H-%M-%S")
@@ -69,26 +101,105 @@ def _backup_path(original: Path, ts: str) -> Path:
     return parent / f"{stem}__{ts}{suffix}"
 
 
-def _log_entry(action: str, original: str, backup: str, reason: str = ""):
-    """Append one line to versions.log."""
+def _write_index(index: dict):
+    """Atomically replace index.json."""
+    tmp = INDEX_FILE.with_suffix(".tmp")
+    tmp.write_bytes(_dumps(index))
+    tmp.replace(INDEX_FILE)
+
+
+def rebuild_index() -> dict:
+    """Re-derive index.json from versions.log, the source of truth."""
+    _ensure_dirs()
+    files = {}
+    data = LOG_FILE.read_bytes()
+    for line in data.splitlines():
+        if not line.strip():
+            continue
+        entry = _loads(line)
+        if entry.get("action") == "version":
+            files.setdefault(entry["original"], []).append({
+                "timestamp": entry["timestamp"],
+                "backup": entry["backup"],
+                "reason": entry.get("reason", ""),
+            })
+    # Size of what was parsed, not a later stat that may include new lines
+    index = {"log_size": len(data), "files": files}
+    _write_index(index)
+    return index
+
+
+def _read_index() -> dict:
+    """Load index.json, rebuilding it if missing or behind the log."""
     _ensure_dirs()
-    ts = datetime.now(timezone.utc).isoformat()
-    entry = json.dumps({
-        "timestamp": ts,
+    try:
+        index = _loads(INDEX_FILE.read_bytes())
+    except (OSError, ValueError):
+        return rebuild_index()
+    if index.get("log_size") != LOG_FILE.stat().st_size:
+        return rebuild_index()
+    return index
+
+
+def _append_entries(entries: list[dict]):
+    """Append entries to versions.log in one write and keep index.json in step."""
+    index = _read_index()
+    data = b"".join(_dumps(e) + b"\n" for e in entries)
+    with open(LOG_FILE, "ab") as f:
+        f.write(data)
+        f.flush()
+        size = os.fstat(f.fileno()).st_size
+
+    # Another process appended in between: its lines are not in this index
+    if size != index["log_size"] + len(data):
+        rebuild_index()
+        return
+    for e in entries:
+        if e["action"] == "version":
+            index["files"].setdefault(e["original"], []).append(
+                {"timestamp": e["timestamp"], "backup": e["backup"], "reason": e["reason"]})
+    index["log_size"] = size
+    _write_index(index)
+
+
+def _log_entry(action: str, original: str, backup: str, reason: str = "",
+               log: list | None = None):
+    """Record one log entry — now, or on exit of the batched_log() given as *log*."""
+    entry = {
+        "timestamp": datetime.now(timezone.utc).isoformat(),
         "action": action,
         "original": original,
         "backup": backup,
         "reason": reason,
-    })
-    with open(LOG_FILE, "a") as f:
-        f.write(entry + "\n")
+    }
+    if log is not None:
+        log.append(entry)
+    else:
+        _append_entries([entry])
+
+
+@contextmanager
+def batched_log():
+    """
+    Collect log entries from several version_file()/rollback() calls and
+    write them, plus the index update, once on exit.
+
+    Entries are flushed even if the block raises, since their backups exist.
+    They become visible to list_versions() only after the block exits.
+    """
+    pending = []
+    try:
+        yield pending
+    finally:
+        if pending:
+            _append_entries(pending)
 
 
 # ---------------------------------------------------------------------------
 # Public API
 # ---------------------------------------------------------------------------
 
-def version_file(filepath, reason: str = "") -> Path:
+def version_file(filepath, reason: str = "", log: list | None = None) -> Path:
     """
     Create a timestamped backup of *filepath* before it is modified.
 
@@ -98,6 +209,8 @@ def version_file(filepath, reason: str = "") -> Path:
         The file to back up (must exist).
     reason : str, optional
         Human-readable note recorded in the log.
+    log : optional
+        The value of an enclosing ``with batched_log() as log`` block.
 
     Returns
     -------
@@ -114,9 +227,11 @@ def version_file(filepath, reason: str = "") -> Path:
 
     ts = _timestamp()
     dst = _backup_path(src, ts)
+    # A real copy, never a hardlink: callers such as evidence-builder.py
+    # rewrite the original in place right after versioning it
     shutil.copy2(src, dst)  # preserves metadata
 
-    _log_entry("version", str(src), str(dst), reason)
+    _log_entry("version", str(src), str(dst), reason, log=log)
     print(f"  ✓ versioned → {dst.relative_to(PROJECT_ROOT)}")
     return dst
 
@@ -127,25 +242,16 @@ def list_versions(filepath) -> list[dict]:
 
     Each entry: {"timestamp": str, "backup": Path, "reason": str}
     """
-    _ensure_dirs()
     src = str(Path(filepath).resolve())
-    versions = []
-    if LOG_FILE.exists():
-        for line in LOG_FILE.read_text().splitlines():
-            if not line.strip():
-                continue
-            entry = json.loads(line)
-            if entry.get("original") == src and entry.get("action") == "version":
-                versions.append({
-                    "timestamp": entry["timestamp"],
-                    "backup": Path(entry["backup"]),
-                    "reason": entry.get("reason", ""),
-                })
+    versions = [
+        {"timestamp": v["timestamp"], "backup": Path(v["backup"]), "reason": v["reason"]}
+        for v in _read_index()["files"].get(src, [])
+    ]
     versions.sort(key=lambda v: v["timestamp"], reverse=True)
     return versions
 
 
-def rollback(filepath, timestamp: str | None = None) -> Path:
+def rollback(filepath, timestamp: str | None = None, log: list | None = None) -> Path:
     """
     Restore *filepath* from a backup.
 
@@ -156,6 +262,8 @@ def rollback(filepath, timestamp: str | None = None) -> Path:
     timestamp : str, optional
         If provided, restore the version matching this timestamp substring.
         If omitted, restore the most recent version.
+    log : optional
+        The value of an enclosing ``with batched_log() as log`` block.
 
     Returns
     -------
@@ -185,26 +293,45 @@ def rollback(filepath, timestamp: str | None = None) -> Path:
 
     # Version the *current* state before overwriting (safety net)
     if target.exists():
-        version_file(target, reason=f"pre-rollback safety snapshot")
+        version_file(target, reason=f"pre-rollback safety snapshot", log=log)
 
     shutil.copy2(backup_src, target)
     _log_entry("rollback", str(target), str(backup_src),
-               f"restored from {chosen['timestamp']}")
+               f"restored from {chosen['timestamp']}", log=log)
     print(f"  ✓ rolled back → {chosen['timestamp']}")
     return backup_src
 
 
+def _tail(path: Path, n: int, block: int = 65536) -> list[bytes]:
+    """Return the last *n* non-blank lines of *path*, reading backwards in blocks."""
+    with open(path, "rb") as f:
+        pos = f.seek(0, os.SEEK_END)
+        data = b""
+        lines = []
+        while pos > 0:
+            step = min(block, pos)
+            pos -= step
+            f.seek(pos)
+            data = f.read(step) + data
+            lines = [l for l in data.split(b"\n") if l.strip()]
+            # unless we hit the start, the first line may be cut mid-way
+            if pos > 0 and len(lines) > n:
+                break
+    if pos > 0:
+        lines = lines[1:]
+    return lines[-n:]
+
+
 def read_log(last: int = 0) -> list[dict]:
     """Read the full log, optionally limited to the last N entries."""
     _ensure_dirs()
-    entries = []
-    if LOG_FILE.exists():
-        for line in LOG_FILE.read_text().splitlines():
-            if line.strip():
-                entries.append(json.loads(line))
+    if not LOG_FILE.exists():
+        return []
     if last > 0:
-        entries = entries[-last:]
-    return entries
+        lines = _tail(LOG_FILE, last)
+    else:
+        lines = [l for l in LOG_FILE.read_bytes().splitlines() if l.strip()]
+    return [_loads(l) for l in lines]
 
 
 # ---------------------------------------------------------------------------
@@ -236,6 +363,9 @@ def main():
     p_log.add_argument("--last", type=int, default=0,
                         help="Show only last N entries")
 
+    # index-rebuild
+    sub.add_parser("index-rebuild", help="Rebuild index.json from the log")
+
     args = parser.parse_args()
 
     if args.command == "version":
@@ -265,6 +395,11 @@ def main():
                 print(f"  [{e['action']:>8}]  {e['timestamp']}{reason}")
                 print(f"            {Path(e['original']).name} → {Path(e['backup']).name}")
 
+    elif args.command == "index-rebuild":
+        files = rebuild_index()["files"]
+        total = sum(len(v) for v in files.values())
+        print(f"  ✓ index rebuilt: {len(files)} file(s), {total} version(s)")
+
     else:
         parser.print_help()
 